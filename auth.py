@@ -6,45 +6,212 @@ Uses SQLite for persistent storage with password hashing for security.
 """
 
 import sqlite3
+import base64
+import binascii
 import hashlib
+import hmac
+import logging
+import random
 import secrets
+import threading
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 # Database path
 DB_PATH = "users.db"
 
+logger = logging.getLogger(__name__)
+
+# hashlib.sha256 resolves to OpenSSL's implementation when CPython is built
+# against it, which uses the CPU's SHA extensions where available
+_OPENSSL_SHA256 = hashlib.sha256.__name__ == "openssl_sha256"
+logger.debug("SHA-256 backend: %s", "OpenSSL" if _OPENSSL_SHA256 else "builtin")
+
+
+# Per-thread persistent connections (opened once, reused across requests)
+_local = threading.local()
+
+# Schema is created lazily on first database access; user_version records
+# that it is in place so later processes skip the CREATE statements
+_SCHEMA_VERSION = 1
+_init_lock = threading.Lock()
+_initialized_path: Optional[str] = None
+
+# Prepared statements kept per connection; sized well above the number of
+# distinct statements in this module so none are evicted and re-parsed
+_STATEMENT_CACHE_SIZE = 256
+
+# Hot-path SQL, kept as constants so each statement text stays identical
+# across calls and is served from the connection's statement cache
+_SQL_LOGIN_SELECT = """
+    SELECT id, username, password_hash, salt, display_name,
+           total_games, highest_score, best_streak
+    FROM users WHERE username = ?
+"""
+
+_SQL_INSERT_SESSION = """
+    INSERT INTO sessions (user_id, session_token, expires_at)
+    VALUES (?, ?, datetime('now', '+30 days'))
+"""
+
+_SQL_UPDATE_LAST_LOGIN = "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?"
+
+_SQL_UPDATE_PASSWORD = "UPDATE users SET password_hash = ?, salt = ? WHERE id = ?"
+
+_SQL_INSERT_GAME = """
+    INSERT INTO game_history
+    (user_id, score, correct_answers, total_questions, best_streak,
+     difficulty, categories, game_mode, timed_mode, completed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_USER_STATS = """
+    UPDATE users SET
+        total_games = total_games + ?,
+        total_score = total_score + ?,
+        highest_score = MAX(highest_score, ?),
+        total_correct = total_correct + ?,
+        total_answered = total_answered + ?,
+        best_streak = MAX(best_streak, ?)
+    WHERE id = ?
+    RETURNING total_games, total_score, highest_score, best_streak
+"""
+
 
 def _get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory enabled."""
-    conn = sqlite3.connect(DB_PATH)
+    """Get this thread's database connection, creating the schema on first use."""
+    _ensure_init()
+    return _thread_connection()
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """
+    Get this thread's persistent database connection.
+
+    The connection is opened on first use (or when DB_PATH changes) with
+    row factory enabled and WAL-mode pragmas applied, then reused for
+    every later call on the same thread instead of reopening the file.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == DB_PATH:
+        return conn
+
+    if conn is not None:
+        conn.close()
+
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE
+    )
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-40000")
+    # Serve page reads from a shared memory map instead of pread() calls
+    conn.execute("PRAGMA mmap_size=268435456")
+
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
 
 
-def _hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
+# Session tokens are 24 random bytes (32 URL-safe base64 characters),
+# generated in batches to amortize the getrandom() syscall
+_TOKEN_BYTES = 24
+_TOKEN_BATCH = 64
+
+
+class _TokenPool(threading.local):
+    """Per-thread pool of session tokens filled from one os.urandom call."""
+
+    def __init__(self) -> None:
+        self._tokens: list[str] = []
+
+    def take(self) -> str:
+        """Return an unused token, refilling the pool when it runs dry."""
+        if not self._tokens:
+            # 24 bytes encode to exactly 32 characters with no padding, so
+            # one encode of the whole buffer slices cleanly into tokens
+            raw = os.urandom(_TOKEN_BYTES * _TOKEN_BATCH)
+            encoded = base64.urlsafe_b64encode(raw).decode()
+            width = _TOKEN_BYTES * 4 // 3
+            self._tokens = [
+                encoded[i:i + width] for i in range(0, len(encoded), width)
+            ]
+        return self._tokens.pop()
+
+
+_token_pool = _TokenPool()
+
+# Chance that a logout also purges expired sessions
+_PURGE_PROBABILITY = 1 / 1024
+
+
+def _token_key(session_token: Union[str, bytes]) -> Optional[bytes]:
+    """
+    Convert a session token to the raw bytes stored in the database.
+
+    Cookies carry the URL-safe base64 form; the sessions table stores the
+    decoded bytes so lookups compare short fixed-width BLOBs.
+
+    Args:
+        session_token: Token as a base64 string, or raw bytes
+
+    Returns:
+        The raw token bytes, or None if the string is not valid base64
+    """
+    if isinstance(session_token, bytes):
+        return session_token
+    try:
+        return base64.urlsafe_b64decode(session_token + "=" * (-len(session_token) % 4))
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _hash_password(password: str, salt: Optional[bytes] = None) -> tuple[bytes, bytes]:
     """
     Hash a password with a salt using SHA-256.
 
     Args:
         password: The plain text password
-        salt: Optional salt, generates new one if not provided
+        salt: Optional salt bytes, generates new one if not provided
 
     Returns:
-        Tuple of (hashed_password, salt)
+        Tuple of (raw digest bytes, salt bytes)
     """
     if salt is None:
-        salt = secrets.token_hex(16)
+        salt = secrets.token_bytes(16)
 
-    salted = f"{salt}{password}"
-    hashed = hashlib.sha256(salted.encode()).hexdigest()
-    return hashed, salt
+    h = hashlib.sha256()
+    h.update(salt)
+    h.update(password.encode())
+    return h.digest(), salt
+
+
+def _ensure_init() -> None:
+    """Run init_auth_db once per DB_PATH, using double-checked locking."""
+    global _initialized_path
+    if _initialized_path == DB_PATH:
+        return
+    with _init_lock:
+        if _initialized_path != DB_PATH:
+            init_auth_db()
+            _initialized_path = DB_PATH
 
 
 def init_auth_db() -> None:
-    """Initialize the authentication database tables."""
-    conn = _get_connection()
+    """
+    Initialize the authentication database tables.
+
+    Skips all schema work when the database's user_version shows it is
+    already at _SCHEMA_VERSION.
+    """
+    conn = _thread_connection()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        return
+
     cursor = conn.cursor()
 
     # Users table
@@ -52,8 +219,8 @@ def init_auth_db() -> None:
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            salt TEXT NOT NULL,
+            password_hash BLOB NOT NULL,
+            salt BLOB NOT NULL,
             display_name TEXT NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             last_login TIMESTAMP,
@@ -72,7 +239,7 @@ def init_auth_db() -> None:
         CREATE TABLE IF NOT EXISTS sessions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id INTEGER NOT NULL,
-            session_token TEXT UNIQUE NOT NULL,
+            session_token BLOB UNIQUE NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             expires_at TIMESTAMP NOT NULL,
             FOREIGN KEY (user_id) REFERENCES users(id)
@@ -98,8 +265,22 @@ def init_auth_db() -> None:
         )
     """)
 
+    # Indexes for rank lookups, recent-games listing and session checks
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_highest_score
+        ON users(highest_score DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_game_history_user_played
+        ON game_history(user_id, played_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_token
+        ON sessions(session_token, user_id, expires_at)
+    """)
+
+    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     conn.commit()
-    conn.close()
 
 
 def register_user(username: str, password: str, display_name: Optional[str] = None) -> dict:
@@ -124,25 +305,19 @@ def register_user(username: str, password: str, display_name: Optional[str] = No
     display_name = display_name or username
 
     conn = _get_connection()
-    cursor = conn.cursor()
 
     # Check if username exists
-    cursor.execute("SELECT id FROM users WHERE username = ?", (username,))
-    if cursor.fetchone():
-        conn.close()
+    if conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone():
         return {"success": False, "error": "Username already taken"}
 
     # Hash password and create user
     password_hash, salt = _hash_password(password)
 
-    cursor.execute("""
-        INSERT INTO users (username, password_hash, salt, display_name)
-        VALUES (?, ?, ?, ?)
-    """, (username, password_hash, salt, display_name))
-
-    user_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        user_id = conn.execute("""
+            INSERT INTO users (username, password_hash, salt, display_name)
+            VALUES (?, ?, ?, ?)
+        """, (username, password_hash, salt, display_name)).lastrowid
 
     return {
         "success": True,
@@ -168,42 +343,36 @@ def login_user(username: str, password: str) -> dict:
     username = username.lower().strip()
 
     conn = _get_connection()
-    cursor = conn.cursor()
 
     # Get user
-    cursor.execute("""
-        SELECT id, username, password_hash, salt, display_name,
-               total_games, highest_score, best_streak
-        FROM users WHERE username = ?
-    """, (username,))
-
-    user = cursor.fetchone()
+    user = conn.execute(_SQL_LOGIN_SELECT, (username,)).fetchone()
     if not user:
-        conn.close()
         return {"success": False, "error": "Invalid username or password"}
 
-    # Verify password
-    password_hash, _ = _hash_password(password, user["salt"])
-    if password_hash != user["password_hash"]:
-        conn.close()
+    # Verify password. Legacy rows store hex text and were hashed over
+    # the salt's hex characters rather than its raw bytes
+    stored_hash = user["password_hash"]
+    salt = user["salt"]
+    legacy = isinstance(stored_hash, str)
+    if legacy:
+        stored_hash = bytes.fromhex(stored_hash)
+        salt = salt.encode()
+
+    password_hash, _ = _hash_password(password, salt)
+    if not hmac.compare_digest(password_hash, stored_hash):
         return {"success": False, "error": "Invalid username or password"}
 
     # Create session
-    session_token = secrets.token_urlsafe(32)
-    expires_at = datetime.now() + timedelta(days=30)
+    session_token = _token_pool.take()
 
-    cursor.execute("""
-        INSERT INTO sessions (user_id, session_token, expires_at)
-        VALUES (?, ?, ?)
-    """, (user["id"], session_token, expires_at))
-
-    # Update last login
-    cursor.execute("""
-        UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?
-    """, (user["id"],))
-
-    conn.commit()
-    conn.close()
+    # Insert session and update last login in a single transaction
+    cursor = conn.cursor()
+    with conn:
+        if legacy:
+            # Rewrite the legacy hex hash in the raw-bytes format
+            cursor.execute(_SQL_UPDATE_PASSWORD, (*_hash_password(password), user["id"]))
+        cursor.execute(_SQL_INSERT_SESSION, (user["id"], _token_key(session_token)))
+        cursor.execute(_SQL_UPDATE_LAST_LOGIN, (user["id"],))
 
     return {
         "success": True,
@@ -219,7 +388,7 @@ def login_user(username: str, password: str) -> dict:
     }
 
 
-def get_user_from_session(session_token: str) -> Optional[dict]:
+def get_user_from_session(session_token: Union[str, bytes]) -> Optional[dict]:
     """
     Get user info from a session token.
 
@@ -232,10 +401,13 @@ def get_user_from_session(session_token: str) -> Optional[dict]:
     if not session_token:
         return None
 
+    token_key = _token_key(session_token)
+    if token_key is None:
+        return None
+
     conn = _get_connection()
-    cursor = conn.cursor()
 
-    cursor.execute("""
+    user = conn.execute("""
         SELECT u.id, u.username, u.display_name, u.total_games,
                u.total_score, u.highest_score, u.total_correct,
                u.total_answered, u.best_streak, u.favorite_category,
@@ -243,10 +415,7 @@ def get_user_from_session(session_token: str) -> Optional[dict]:
         FROM sessions s
         JOIN users u ON s.user_id = u.id
         WHERE s.session_token = ? AND s.expires_at > CURRENT_TIMESTAMP
-    """, (session_token,))
-
-    user = cursor.fetchone()
-    conn.close()
+    """, (token_key,)).fetchone()
 
     if not user:
         return None
@@ -254,7 +423,7 @@ def get_user_from_session(session_token: str) -> Optional[dict]:
     return dict(user)
 
 
-def logout_user(session_token: str) -> bool:
+def logout_user(session_token: Union[str, bytes]) -> bool:
     """
     Delete a user's session.
 
@@ -264,15 +433,37 @@ def logout_user(session_token: str) -> bool:
     Returns:
         True if session was deleted
     """
+    token_key = _token_key(session_token)
+    if token_key is None:
+        return False
+
     conn = _get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM sessions WHERE session_token = ?", (session_token,))
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    with conn:
+        deleted = conn.execute(
+            "DELETE FROM sessions WHERE session_token = ?", (token_key,)
+        ).rowcount > 0
+
+    # Sampled cleanup keeps the sessions table near its live size
+    if random.random() < _PURGE_PROBABILITY:
+        purge_expired_sessions()
+
     return deleted
 
 
+def purge_expired_sessions() -> int:
+    """
+    Delete all expired sessions.
+
+    Returns:
+        Number of sessions removed
+    """
+    conn = _get_connection()
+    with conn:
+        return conn.execute(
+            "DELETE FROM sessions WHERE expires_at <= CURRENT_TIMESTAMP"
+        ).rowcount
+
+
 def save_game_result(user_id: int, result: dict) -> dict:
     """
     Save a game result and update user stats.
@@ -284,56 +475,57 @@ def save_game_result(user_id: int, result: dict) -> dict:
     Returns:
         Updated user stats
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    return save_game_results_bulk(user_id, [result])
 
-    # Insert game history
-    cursor.execute("""
-        INSERT INTO game_history
-        (user_id, score, correct_answers, total_questions, best_streak,
-         difficulty, categories, game_mode, timed_mode, completed)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        user_id,
-        result.get("score", 0),
-        result.get("correct", 0),
-        result.get("total", 0),
-        result.get("best_streak", 0),
-        result.get("difficulty", ""),
-        result.get("categories", ""),
-        result.get("game_mode", "solo"),
-        1 if result.get("timed_mode") else 0,
-        1 if result.get("completed", True) else 0
-    ))
-
-    # Update user stats
-    cursor.execute("""
-        UPDATE users SET
-            total_games = total_games + 1,
-            total_score = total_score + ?,
-            highest_score = MAX(highest_score, ?),
-            total_correct = total_correct + ?,
-            total_answered = total_answered + ?,
-            best_streak = MAX(best_streak, ?)
-        WHERE id = ?
-    """, (
-        result.get("score", 0),
-        result.get("score", 0),
-        result.get("correct", 0),
-        result.get("total", 0),
-        result.get("best_streak", 0),
-        user_id
-    ))
-
-    # Get updated stats
-    cursor.execute("""
-        SELECT total_games, total_score, highest_score, best_streak
-        FROM users WHERE id = ?
-    """, (user_id,))
 
-    stats = cursor.fetchone()
-    conn.commit()
-    conn.close()
+def save_game_results_bulk(user_id: int, results: list[dict]) -> dict:
+    """
+    Save several game results for one user in a single transaction.
+
+    Inserts all history rows with executemany and applies one aggregate
+    stats update, so importing or replaying N games costs one commit.
+
+    Args:
+        user_id: The user's ID
+        results: List of game result dicts (same shape as save_game_result)
+
+    Returns:
+        Updated user stats, or an empty dict if nothing was saved
+    """
+    if not results:
+        return {}
+
+    rows = [
+        (
+            user_id,
+            result.get("score", 0),
+            result.get("correct", 0),
+            result.get("total", 0),
+            result.get("best_streak", 0),
+            result.get("difficulty", ""),
+            result.get("categories", ""),
+            result.get("game_mode", "solo"),
+            1 if result.get("timed_mode") else 0,
+            1 if result.get("completed", True) else 0
+        )
+        for result in results
+    ]
+
+    conn = _get_connection()
+
+    # Insert game history and update user stats in one transaction;
+    # RETURNING hands back the updated stats without a follow-up SELECT
+    with conn:
+        conn.executemany(_SQL_INSERT_GAME, rows)
+        stats = conn.execute(_SQL_UPDATE_USER_STATS, (
+            len(rows),
+            sum(row[1] for row in rows),
+            max(row[1] for row in rows),
+            sum(row[2] for row in rows),
+            sum(row[3] for row in rows),
+            max(row[4] for row in rows),
+            user_id
+        )).fetchone()
 
     return dict(stats) if stats else {}
 
@@ -349,23 +541,19 @@ def get_user_stats(user_id: int) -> dict:
         Dict with user stats and recent games
     """
     conn = _get_connection()
-    cursor = conn.cursor()
 
     # Get user stats
-    cursor.execute("""
+    user = conn.execute("""
         SELECT username, display_name, total_games, total_score,
                highest_score, total_correct, total_answered, best_streak,
                created_at
         FROM users WHERE id = ?
-    """, (user_id,))
-
-    user = cursor.fetchone()
+    """, (user_id,)).fetchone()
     if not user:
-        conn.close()
         return {}
 
     # Get recent games
-    cursor.execute("""
+    rows = conn.execute("""
         SELECT score, correct_answers, total_questions, best_streak,
                difficulty, game_mode, timed_mode, played_at
         FROM game_history
@@ -374,15 +562,13 @@ def get_user_stats(user_id: int) -> dict:
         LIMIT 10
     """, (user_id,))
 
-    recent_games = [dict(row) for row in cursor.fetchall()]
+    recent_games = [dict(row) for row in rows]
 
     # Calculate accuracy
     accuracy = 0
     if user["total_answered"] > 0:
         accuracy = round((user["total_correct"] / user["total_answered"]) * 100, 1)
 
-    conn.close()
-
     return {
         **dict(user),
         "accuracy": accuracy,
@@ -401,22 +587,25 @@ def get_user_rank(user_id: int) -> dict:
         Dict with rank info
     """
     conn = _get_connection()
-    cursor = conn.cursor()
 
-    # Get rank by highest score
-    cursor.execute("""
-        SELECT COUNT(*) + 1 as rank
-        FROM users
-        WHERE highest_score > (SELECT highest_score FROM users WHERE id = ?)
-    """, (user_id,))
+    # Look up the user's score first so the rank count is a plain
+    # index range scan rather than a correlated subquery
+    user = conn.execute(
+        "SELECT highest_score FROM users WHERE id = ?", (user_id,)
+    ).fetchone()
 
-    rank = cursor.fetchone()
+    rank = None
+    if user:
+        rank = conn.execute("""
+            SELECT COUNT(*) + 1 as rank
+            FROM users
+            WHERE highest_score > ?
+        """, (user["highest_score"],)).fetchone()
 
     # Get total users
-    cursor.execute("SELECT COUNT(*) as total FROM users WHERE total_games > 0")
-    total = cursor.fetchone()
-
-    conn.close()
+    total = conn.execute(
+        "SELECT COUNT(*) as total FROM users WHERE total_games > 0"
+    ).fetchone()
 
     return {
         "rank": rank["rank"] if rank else 0,
@@ -424,5 +613,32 @@ def get_user_rank(user_id: int) -> dict:
     }
 
 
-# Initialize database on module load
-init_auth_db()
+def get_leaderboard(limit: int = 100) -> list[dict]:
+    """
+    Get the top registered players with accuracy and rank.
+
+    Accuracy and rank are computed by SQLite in the same query, so the
+    whole board is built in one pass instead of per-user lookups.
+
+    Args:
+        limit: Maximum number of players to return
+
+    Returns:
+        List of player dicts ordered by highest score
+    """
+    conn = _get_connection()
+
+    rows = conn.execute("""
+        SELECT id, username, display_name, total_games, highest_score,
+               best_streak,
+               CASE WHEN total_answered > 0
+                    THEN ROUND(total_correct * 100.0 / total_answered, 1)
+                    ELSE 0 END AS accuracy,
+               RANK() OVER (ORDER BY highest_score DESC) AS rank
+        FROM users
+        WHERE total_games > 0
+        ORDER BY highest_score DESC
+        LIMIT ?
+    """, (limit,))
+
+    return [dict(row) for row in rows]
@@ -6,11 +6,11 @@ including:
 - Score calculation with difficulty-based points
 - Streak tracking and bonus multipliers
 - Lives system (3 lives, lose one per wrong answer)
-- Immutable game state management
+- Game state management
 
-The engine is designed to be stateless - it receives game state and
-returns updated state, making it easy to test and integrate with
-different frontends (CLI, web, etc.).
+The engine holds no state of its own - callers own a GameState, which
+the engine functions read and update in place, making it easy to test
+and integrate with different frontends (CLI, web, etc.).
 
 This module does NOT handle:
 - Question loading (see question_bank module)
@@ -19,7 +19,9 @@ This module does NOT handle:
 """
 
 from __future__ import annotations
-from typing import TypedDict, Optional, Any
+from array import array
+from dataclasses import dataclass
+from typing import TypedDict, Optional, Any, Sequence
 
 # Points awarded per difficulty level
 DIFFICULTY_POINTS: dict[str, int] = {
@@ -28,6 +30,11 @@ DIFFICULTY_POINTS: dict[str, int] = {
     "hard": 30,
 }
 
+# Difficulty names tokenized to small ints, indexing a flat points table;
+# unknown difficulties map to the "easy" slot (10 points)
+_DIFF_INDEX: dict[str, int] = {name: i for i, name in enumerate(DIFFICULTY_POINTS)}
+_POINTS: array[int] = array("i", DIFFICULTY_POINTS.values())
+
 # Streak bonus multipliers (streak_length: multiplier)
 # When a player reaches a streak threshold, they get the corresponding multiplier
 STREAK_BONUSES: dict[int, float] = {
@@ -36,6 +43,19 @@ STREAK_BONUSES: dict[int, float] = {
     10: 3.0,  # 200% bonus at 10 streak
 }
 
+# STREAK_BONUSES sorted by threshold, highest first
+_STREAK_SORTED_DESC: tuple[tuple[int, float], ...] = tuple(
+    sorted(STREAK_BONUSES.items(), reverse=True)
+)
+
+# Multiplier for every streak length up to the cap, so the lookup is a
+# single index; longer streaks share the capped entry
+_STREAK_CAP: int = 255
+_MULT_BY_STREAK: tuple[float, ...] = tuple(
+    next((bonus for threshold, bonus in _STREAK_SORTED_DESC if s >= threshold), 1.0)
+    for s in range(_STREAK_CAP + 1)
+)
+
 # Number of lives players start with
 STARTING_LIVES: int = 3
 
@@ -58,15 +78,19 @@ class Question(TypedDict):
     difficulty: str
 
 
-class GameState(TypedDict):
+@dataclass(slots=True)
+class GameState:
     """
-    TypedDict representing the complete state of a game session.
+    Slotted dataclass representing the complete state of a game session.
 
-    The game state is immutable - functions return new state objects
-    rather than modifying the existing state.
+    Fields are stored in slots rather than a per-instance dict, so the
+    per-answer reads and writes in submit_answer are plain attribute
+    accesses. The state belongs to a single game session and is updated
+    in place by submit_answer.
 
     Attributes:
         questions: List of all questions for this game.
+        num_questions: len(questions), fixed once the game starts.
         current_question_index: Index of the next question to answer.
         score: Cumulative score earned.
         lives: Remaining lives (game ends at 0).
@@ -74,8 +98,11 @@ class GameState(TypedDict):
         max_streak: Best streak achieved this game.
         correct_answers: Total correct answers given.
         total_answered: Total questions answered (correct or not).
+        answers: Correct answer index per question, parallel to questions.
+        base_points: Difficulty points per question, parallel to questions.
     """
     questions: list[Question]
+    num_questions: int
     current_question_index: int
     score: int
     lives: int
@@ -83,6 +110,8 @@ class GameState(TypedDict):
     max_streak: int
     correct_answers: int
     total_answered: int
+    answers: array[int]
+    base_points: array[int]
 
 
 def start_game(questions: list[Question]) -> GameState:
@@ -90,7 +119,8 @@ def start_game(questions: list[Question]) -> GameState:
     Initialize a new game session with the provided questions.
 
     Creates a fresh game state with:
-    - All questions loaded
+    - All questions loaded, with each question's answer index and
+      difficulty points extracted into flat per-question int arrays
     - Score at 0
     - Full lives (STARTING_LIVES)
     - No streak or answers recorded
@@ -104,6 +134,7 @@ def start_game(questions: list[Question]) -> GameState:
     """
     return GameState(
         questions=questions,
+        num_questions=len(questions),
         current_question_index=0,
         score=0,
         lives=STARTING_LIVES,
@@ -111,6 +142,8 @@ def start_game(questions: list[Question]) -> GameState:
         max_streak=0,
         correct_answers=0,
         total_answered=0,
+        answers=array("i", [q["answer"] for q in questions]),
+        base_points=array("i", [_POINTS[_DIFF_INDEX.get(q["difficulty"], 0)] for q in questions]),
     )
 
 
@@ -125,12 +158,10 @@ def get_current_question(game_state: GameState) -> Optional[Question]:
         The current Question if there are remaining questions,
         or None if all questions have been answered.
     """
-    index = game_state["current_question_index"]
-    questions = game_state["questions"]
-
-    if index >= len(questions):
+    index = game_state.current_question_index
+    if index >= game_state.num_questions:
         return None
-    return questions[index]
+    return game_state.questions[index]
 
 
 def _calculate_streak_multiplier(streak: int) -> float:
@@ -138,7 +169,8 @@ def _calculate_streak_multiplier(streak: int) -> float:
     Calculate the score multiplier based on current streak.
 
     The multiplier is determined by the highest streak threshold
-    that has been reached. Thresholds are defined in STREAK_BONUSES.
+    that has been reached. Thresholds are defined in STREAK_BONUSES
+    and precomputed per streak length in _MULT_BY_STREAK.
 
     Args:
         streak: The current number of consecutive correct answers.
@@ -146,11 +178,21 @@ def _calculate_streak_multiplier(streak: int) -> float:
     Returns:
         The multiplier to apply to base points (1.0 if no bonus applies).
     """
-    multiplier = 1.0
-    for threshold, bonus in sorted(STREAK_BONUSES.items()):
-        if streak >= threshold:
-            multiplier = bonus
-    return multiplier
+    return _MULT_BY_STREAK[streak] if streak <= _STREAK_CAP else _MULT_BY_STREAK[_STREAK_CAP]
+
+
+def _score_update(base_points: int, streak: int) -> int:
+    """
+    Calculate the points for a correct answer.
+
+    Args:
+        base_points: Difficulty-based points for the question.
+        streak: The streak length including this answer.
+
+    Returns:
+        The points earned, with the streak multiplier applied.
+    """
+    return int(base_points * _calculate_streak_multiplier(streak))
 
 
 def submit_answer(
@@ -167,8 +209,8 @@ def submit_answer(
     - Decrements lives on wrong answers
     - Advances to the next question
 
-    The function returns a new GameState rather than modifying
-    the input state (immutable update pattern).
+    The game state is updated in place and also returned for
+    convenience.
 
     Args:
         game_state: The current game state.
@@ -178,45 +220,74 @@ def submit_answer(
         A tuple containing:
         - is_correct: Whether the answer was correct
         - points_earned: Points awarded for this answer (0 if wrong)
-        - new_state: Updated GameState with all changes applied
+        - game_state: The same GameState, with all changes applied
     """
-    question = get_current_question(game_state)
-    if question is None:
+    index = game_state.current_question_index
+    if index >= game_state.num_questions:
         return (False, 0, game_state)
 
-    is_correct = answer_index == question["answer"]
+    is_correct = answer_index == game_state.answers[index]
     points_earned = 0
 
-    # Create new state (immutable update)
-    new_state = GameState(
-        questions=game_state["questions"],
-        current_question_index=game_state["current_question_index"] + 1,
-        score=game_state["score"],
-        lives=game_state["lives"],
-        streak=game_state["streak"],
-        max_streak=game_state["max_streak"],
-        correct_answers=game_state["correct_answers"],
-        total_answered=game_state["total_answered"] + 1,
-    )
+    game_state.current_question_index = index + 1
+    game_state.total_answered += 1
 
     if is_correct:
         # Update streak
-        new_streak = game_state["streak"] + 1
-        new_state["streak"] = new_streak
-        new_state["max_streak"] = max(game_state["max_streak"], new_streak)
-        new_state["correct_answers"] = game_state["correct_answers"] + 1
+        streak = game_state.streak + 1
+        game_state.streak = streak
+        if streak > game_state.max_streak:
+            game_state.max_streak = streak
+        game_state.correct_answers += 1
 
         # Calculate points with streak bonus
-        base_points = DIFFICULTY_POINTS.get(question["difficulty"], 10)
-        multiplier = _calculate_streak_multiplier(new_streak)
-        points_earned = int(base_points * multiplier)
-        new_state["score"] = game_state["score"] + points_earned
+        points_earned = _score_update(game_state.base_points[index], streak)
+        game_state.score += points_earned
     else:
         # Wrong answer: lose life and reset streak
-        new_state["lives"] = game_state["lives"] - 1
-        new_state["streak"] = 0
+        game_state.lives -= 1
+        game_state.streak = 0
+
+    return (is_correct, points_earned, game_state)
+
+
+def replay_scores(
+    difficulties: Sequence[str],
+    correct: Sequence[bool]
+) -> tuple[int, int, int]:
+    """
+    Replay a sequence of answers through the scoring rules.
+
+    Applies the same points, streak and lives rules as submit_answer,
+    but works on plain sequences without building questions or GameState
+    objects. Intended for batch simulation and balance tuning.
+
+    Args:
+        difficulties: Difficulty of each question, in play order.
+        correct: Whether each question was answered correctly.
+
+    Returns:
+        A tuple of (score, max_streak, lives_remaining). Replay stops
+        once lives run out, as in a real game.
+    """
+    score = 0
+    streak = 0
+    max_streak = 0
+    lives = STARTING_LIVES
+
+    for difficulty, is_correct in zip(difficulties, correct):
+        if lives <= 0:
+            break
+        if is_correct:
+            streak += 1
+            if streak > max_streak:
+                max_streak = streak
+            score += _score_update(DIFFICULTY_POINTS.get(difficulty, 10), streak)
+        else:
+            lives -= 1
+            streak = 0
 
-    return (is_correct, points_earned, new_state)
+    return score, max_streak, lives
 
 
 def is_game_over(game_state: GameState) -> bool:
@@ -233,8 +304,8 @@ def is_game_over(game_state: GameState) -> bool:
     Returns:
         True if the game is over, False if play should continue.
     """
-    no_lives = game_state["lives"] <= 0
-    no_questions = game_state["current_question_index"] >= len(game_state["questions"])
+    no_lives = game_state.lives <= 0
+    no_questions = game_state.current_question_index >= game_state.num_questions
     return no_lives or no_questions
 
 
@@ -258,18 +329,18 @@ def get_final_score(game_state: GameState) -> dict[str, Any]:
         - lives_remaining: Lives left at game end (0 if ran out)
         - completed: Whether all questions were answered
     """
-    total = game_state["total_answered"]
-    correct = game_state["correct_answers"]
+    total = game_state.total_answered
+    correct = game_state.correct_answers
     accuracy = (correct / total * 100) if total > 0 else 0.0
 
     return {
-        "score": game_state["score"],
+        "score": game_state.score,
         "correct_answers": correct,
         "total_answered": total,
         "accuracy": round(accuracy, 1),
-        "max_streak": game_state["max_streak"],
-        "lives_remaining": game_state["lives"],
-        "completed": game_state["current_question_index"] >= len(game_state["questions"]),
+        "max_streak": game_state.max_streak,
+        "lives_remaining": game_state.lives,
+        "completed": game_state.current_question_index >= game_state.num_questions,
     }
 
 
@@ -319,7 +390,7 @@ if __name__ == "__main__":
     # Start game
     state = start_game(mock_questions)
     print(f"Game started with {len(mock_questions)} questions")
-    print(f"Starting lives: {state['lives']}\n")
+    print(f"Starting lives: {state.lives}\n")
 
     # Simulate gameplay: correct, correct, correct (streak!), wrong, correct
     test_answers = [2, 1, 1, 0, 0]  # indices to submit
@@ -340,10 +411,10 @@ if __name__ == "__main__":
         is_correct, points, state = submit_answer(state, answer)
 
         if is_correct:
-            print(f"  CORRECT! +{points} points (streak: {state['streak']})")
+            print(f"  CORRECT! +{points} points (streak: {state.streak})")
         else:
-            print(f"  WRONG! Lost a life. Lives remaining: {state['lives']}")
-        print(f"  Current score: {state['score']}\n")
+            print(f"  WRONG! Lost a life. Lives remaining: {state.lives}")
+        print(f"  Current score: {state.score}\n")
 
     # Final results
     print("=== Final Results ===")
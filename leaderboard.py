@@ -11,13 +11,82 @@ using a SQLite database. Features include:
 The leaderboard is stored in a local SQLite database file (leaderboard.db).
 """
 
+import hashlib
+import queue
 import sqlite3
-from datetime import datetime
-from typing import Optional, Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Any
+
+import orjson
 
 # Path to the SQLite database file
 DATABASE_PATH: str = "leaderboard.db"
 
+# Maximum number of idle connections kept for reuse
+_POOL_SIZE: int = 8
+
+# Idle (path, connection) pairs; LIFO so the warmest connection is reused first
+_POOL: "queue.LifoQueue[tuple[str, sqlite3.Connection]]" = queue.LifoQueue(maxsize=_POOL_SIZE)
+
+# Number of places shown on the leaderboard
+_TOP_N: int = 10
+
+# Lowest score currently in the top 10 (0 while fewer than 10 scores exist).
+# Scores are only ever added, so a stale value is too low, never too high:
+# it can cost an extra rank query but never hides a leaderboard entry.
+_TOP10_CUTOFF: int = 0
+
+# Seconds a cached top-scores list may be served before it is re-queried.
+# Saves in this process invalidate immediately; the TTL only bounds how
+# long writes from other processes sharing the database go unseen.
+_CACHE_TTL: float = 30.0
+
+# Last top-scores result with its serialized body and ETag;
+# "gen" is bumped on every invalidation
+_cache: dict[str, Any] = {"scores": None, "body": b"", "limit": 0, "etag": "", "ts": 0.0, "gen": 0}
+_cache_lock = threading.Lock()
+
+# Hot-path SQL, kept as constants so each statement text stays identical
+# across calls and is served from the pooled connection's statement cache
+_SQL_INSERT: str = """
+    INSERT INTO high_scores (player_name, score, category, difficulty, total_questions)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_TOP: str = """
+    SELECT player_name, score, strftime('%Y-%m-%d', date, 'unixepoch', 'localtime'),
+           category, difficulty, total_questions
+    FROM high_scores ORDER BY score DESC, id LIMIT ?
+"""
+
+_SQL_PLAYER_BEST: str = """
+    SELECT player_name, score, strftime('%Y-%m-%d', date, 'unixepoch', 'localtime') AS date,
+           category, difficulty
+    FROM high_scores WHERE player_name = ? ORDER BY score DESC LIMIT 1
+"""
+
+# Equal scores rank by who set them first, matching _SQL_TOP and idx_top_scores
+_SQL_RANK_CHECK: str = """
+    SELECT COUNT(*) FROM high_scores WHERE score > ? OR (score = ? AND id < ?)
+"""
+
+_SQL_CUTOFF: str = "SELECT score FROM high_scores ORDER BY score DESC LIMIT 1 OFFSET ?"
+
+# high_scores schema; date is stored as unix epoch seconds
+_CREATE_TABLE_SQL: str = """
+    CREATE TABLE IF NOT EXISTS high_scores (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_name TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        date INTEGER NOT NULL DEFAULT (unixepoch()),
+        category TEXT,
+        difficulty TEXT,
+        total_questions INTEGER
+    )
+"""
+
 
 def _get_connection() -> sqlite3.Connection:
     """
@@ -25,15 +94,60 @@ def _get_connection() -> sqlite3.Connection:
 
     The connection is configured with sqlite3.Row as the row factory,
     allowing column access by name (dict-like) in addition to index.
+    It runs in autocommit mode and may be shared across threads, so it
+    can be parked in the connection pool between requests.
 
     Returns:
         A sqlite3.Connection object ready for queries.
     """
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None)
     conn.row_factory = sqlite3.Row
+    # Wait for a concurrent writer instead of raising "database is locked"
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
     return conn
 
 
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a pooled connection for the duration of a with-block.
+
+    Reuses an idle connection when one is available for the current
+    DATABASE_PATH, otherwise opens a new one. The connection is returned
+    to the pool afterwards, or closed if the pool is full or the
+    database path has changed in the meantime.
+
+    Yields:
+        A sqlite3.Connection object ready for queries.
+    """
+    path = DATABASE_PATH
+    while True:
+        try:
+            pooled_path, conn = _POOL.get_nowait()
+        except queue.Empty:
+            conn = _get_connection()
+            break
+        if pooled_path == path:
+            break
+        conn.close()
+
+    try:
+        yield conn
+    finally:
+        if path != DATABASE_PATH or conn.in_transaction:
+            conn.close()
+        else:
+            try:
+                _POOL.put_nowait((path, conn))
+            except queue.Full:
+                conn.close()
+
+
 def init_db() -> None:
     """
     Initialize the leaderboard database table.
@@ -42,30 +156,84 @@ def init_db() -> None:
     is automatically called on module import to ensure the database
     is ready for use.
 
+    The database is switched to write-ahead logging so leaderboard
+    reads are not blocked while a score is being saved. The journal
+    mode is persistent, so it only needs to be set here.
+
     The table schema includes:
     - id: Auto-incrementing primary key
     - player_name: Display name of the player
     - score: Total points achieved
-    - date: Timestamp of when the score was recorded
+    - date: Unix timestamp of when the score was recorded (set by SQLite)
     - category: Optional category filter used
     - difficulty: Optional difficulty setting used
     - total_questions: Number of questions in the game
+
+    Databases created with the older TEXT date column are migrated in
+    place. Indexes on (score, id) and on (player_name, score) keep the top-scores and
+    personal-best lookups from scanning the whole table.
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS high_scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_name TEXT NOT NULL,
-            score INTEGER NOT NULL,
-            date TEXT NOT NULL,
-            category TEXT,
-            difficulty TEXT,
-            total_questions INTEGER
-        )
-    """)
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_CREATE_TABLE_SQL)
+        _migrate_text_dates(conn)
+        # Covering index in the top-scores order (ties by id), so that query
+        # and the rank check are answered from the index with no sort step
+        conn.execute("DROP INDEX IF EXISTS idx_top")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_top_scores
+            ON high_scores(score DESC, id, player_name, date, category, difficulty, total_questions)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_best
+            ON high_scores(player_name, score DESC)
+        """)
+        _refresh_top10_cutoff(conn)
+    _invalidate_cache()
+
+
+def _migrate_text_dates(conn: sqlite3.Connection) -> None:
+    """
+    Convert a legacy TEXT date column to unix epoch seconds.
+
+    Older databases stored dates as local-time "YYYY-MM-DD HH:MM:SS"
+    strings. The table is rebuilt with the INTEGER column and existing
+    rows are converted; its indexes are recreated by init_db afterwards.
+
+    Args:
+        conn: An open leaderboard connection in autocommit mode.
+    """
+    columns = {row["name"]: row["type"] for row in conn.execute("PRAGMA table_info(high_scores)")}
+    if columns.get("date", "").upper() != "TEXT":
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("ALTER TABLE high_scores RENAME TO high_scores_legacy")
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.execute("""
+            INSERT INTO high_scores (id, player_name, score, date, category, difficulty, total_questions)
+            SELECT id, player_name, score, CAST(strftime('%s', date, 'utc') AS INTEGER),
+                   category, difficulty, total_questions
+            FROM high_scores_legacy
+        """)
+        conn.execute("DROP TABLE high_scores_legacy")
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _refresh_top10_cutoff(conn: sqlite3.Connection) -> None:
+    """
+    Reload the cached top-10 cutoff score from the database.
+
+    Args:
+        conn: An open leaderboard connection.
+    """
+    global _TOP10_CUTOFF
+    row = conn.execute(_SQL_CUTOFF, (_TOP_N - 1,)).fetchone()
+    _TOP10_CUTOFF = row[0] if row else 0
 
 
 def save_score(
@@ -78,8 +246,10 @@ def save_score(
     """
     Save a player's score to the leaderboard.
 
-    Records the score with timestamp and optional game metadata.
-    Also checks if the score qualifies for the top 10 leaderboard.
+    Records the score with optional game metadata; SQLite stamps the
+    row with the current time.
+    Also checks if the score qualifies for the top 10 leaderboard;
+    equal scores are ranked by who set them first.
 
     Args:
         player_name: Display name of the player.
@@ -94,34 +264,24 @@ def save_score(
         - made_leaderboard: Whether the score is in the top 10
         - rank: Position in top 10 (1-10) or None if not ranked
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
-
-    date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with _connection() as conn:
+        row_id = conn.execute(
+            _SQL_INSERT, (player_name, score, category, difficulty, total_questions)
+        ).lastrowid
+        _invalidate_cache()
 
-    cursor.execute(
-        "INSERT INTO high_scores (player_name, score, date, category, difficulty, total_questions) VALUES (?, ?, ?, ?, ?, ?)",
-        (player_name, score, date, category, difficulty, total_questions)
-    )
-    score_id = cursor.lastrowid
-    conn.commit()
-
-    # Check rank
-    cursor.execute(
-        "SELECT id FROM high_scores ORDER BY score DESC LIMIT 10"
-    )
-    top_ids = [row["id"] for row in cursor.fetchall()]
-    conn.close()
+        # Common case: the score is below the 10th place, no rank query needed
+        if score < _TOP10_CUTOFF:
+            return {"success": True, "made_leaderboard": False, "rank": None}
 
-    rank = None
-    made_leaderboard = score_id in top_ids
-    if made_leaderboard:
-        rank = top_ids.index(score_id) + 1
+        rank = conn.execute(_SQL_RANK_CHECK, (score, score, row_id)).fetchone()[0] + 1
+        _refresh_top10_cutoff(conn)
 
+    made_leaderboard = rank <= _TOP_N
     return {
         "success": True,
         "made_leaderboard": made_leaderboard,
-        "rank": rank
+        "rank": rank if made_leaderboard else None
     }
 
 
@@ -145,28 +305,108 @@ def get_top_scores(limit: int = 10) -> list[dict[str, Any]]:
         - difficulty: Difficulty setting used (may be None)
         - total_questions: Number of questions in the game
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    return get_cached_top_scores(limit)[0]
 
-    cursor.execute(
-        "SELECT player_name, score, date, category, difficulty, total_questions FROM high_scores ORDER BY score DESC LIMIT ?",
-        (limit,)
-    )
 
-    scores = []
-    for i, row in enumerate(cursor.fetchall()):
-        scores.append({
-            "rank": i + 1,
-            "player_name": row["player_name"],
-            "score": row["score"],
-            "date": row["date"].split(" ")[0] if row["date"] else None,
-            "category": row["category"],
-            "difficulty": row["difficulty"],
-            "total_questions": row["total_questions"]
-        })
+def get_cached_top_scores(limit: int = 10) -> tuple[list[dict[str, Any]], str]:
+    """
+    Get the top scores together with an ETag for HTTP caching.
+
+    Results are cached in-process for _CACHE_TTL seconds and dropped as
+    soon as a new score is saved, so bursts of leaderboard views share a
+    single query.
+
+    Args:
+        limit: Maximum number of scores to return (default 10).
+
+    Returns:
+        A tuple of (scores, etag), where scores is the list described in
+        get_top_scores and etag is a quoted hash of its contents.
+    """
+    scores, _, etag = _cached_top_scores(limit)
+    return scores, etag
+
+
+def get_top_scores_json(limit: int = 10) -> tuple[bytes, str]:
+    """
+    Get the top scores as a pre-serialized JSON body with its ETag.
+
+    The body is serialized once per cache fill, so cached requests can
+    write it out directly without encoding anything.
+
+    Args:
+        limit: Maximum number of scores to return (default 10).
+
+    Returns:
+        A tuple of (body, etag), where body is the UTF-8 JSON encoding
+        of {"scores": [...]} and etag is a quoted hash of it.
+    """
+    _, body, etag = _cached_top_scores(limit)
+    return body, etag
+
 
-    conn.close()
-    return scores
+def _cached_top_scores(limit: int) -> tuple[list[dict[str, Any]], bytes, str]:
+    """
+    Return the cached top scores, re-querying once the entry is stale.
+
+    Args:
+        limit: Maximum number of scores to return.
+
+    Returns:
+        A tuple of (scores, body, etag).
+    """
+    with _cache_lock:
+        if (_cache["limit"] == limit
+                and time.monotonic() - _cache["ts"] < _CACHE_TTL):
+            return _cache["scores"], _cache["body"], _cache["etag"]
+        gen = _cache["gen"]
+
+    scores = _query_top_scores(limit)
+    body = orjson.dumps({"scores": scores})
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+    with _cache_lock:
+        # Skip the store if a save invalidated the cache while we queried
+        if _cache["gen"] == gen:
+            _cache.update(scores=scores, body=body, limit=limit, etag=etag, ts=time.monotonic())
+    return scores, body, etag
+
+
+def _invalidate_cache() -> None:
+    """Drop the cached top-scores list so the next read re-queries."""
+    with _cache_lock:
+        _cache["ts"] = 0.0
+        _cache["gen"] += 1
+
+
+def _query_top_scores(limit: int) -> list[dict[str, Any]]:
+    """
+    Query the top scores from the database, bypassing the cache.
+
+    Args:
+        limit: Maximum number of scores to return.
+
+    Returns:
+        A list of score dictionaries as described in get_top_scores.
+    """
+    with _connection() as conn:
+        # Plain tuples: rows are unpacked positionally, no sqlite3.Row lookups
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(_SQL_TOP, (limit,))
+        return [
+            {
+                "rank": rank,
+                "player_name": name,
+                "score": score,
+                "date": date,
+                "category": category,
+                "difficulty": difficulty,
+                "total_questions": total_questions
+            }
+            for rank, (name, score, date, category, difficulty, total_questions)
+            in enumerate(cursor, 1)
+        ]
 
 
 def get_player_best(player_name: str) -> Optional[dict[str, Any]]:
@@ -189,22 +429,14 @@ def get_player_best(player_name: str) -> Optional[dict[str, Any]]:
 
         Returns None if the player has no recorded scores.
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "SELECT player_name, score, date, category, difficulty FROM high_scores WHERE player_name = ? ORDER BY score DESC LIMIT 1",
-        (player_name,)
-    )
-
-    row = cursor.fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute(_SQL_PLAYER_BEST, (player_name,)).fetchone()
 
     if row:
         return {
             "player_name": row["player_name"],
             "score": row["score"],
-            "date": row["date"].split(" ")[0] if row["date"] else None,
+            "date": row["date"],
             "category": row["category"],
             "difficulty": row["difficulty"]
         }
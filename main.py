@@ -12,38 +12,158 @@ The application provides both REST API endpoints for game logic
 and HTML template rendering for the frontend.
 """
 
-from fastapi import FastAPI, Request, Depends, Form, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, Form, Query, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import List, Optional, Any, Union
+from logging.handlers import QueueHandler, QueueListener
+from uuid import uuid4
+import asyncio
+import atexit
+import functools
+import logging
+import queue
 import random
 import json
+import time
+
+import orjson
 
-from database import engine, get_db, Base
-from models import Score
 import question_bank
 import leaderboard
 import rooms
 import auth
-from websocket_manager import manager
+from websocket_manager import manager, MessageType, MAX_MESSAGE_SIZE
 from fastapi.responses import RedirectResponse
 
-# Store questions in memory for answer checking (keyed by session)
-# In production, you'd use a proper session store
-_active_questions: dict[int, dict[str, Any]] = {}
+# Records are handed to a background thread for writing, so logging from
+# a request or WebSocket handler never blocks the event loop on stderr
+logger = logging.getLogger(__name__)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Difficulty points for scoring
+DIFFICULTY_POINTS = {"easy": 10, "medium": 20, "hard": 30}
+
+# Difficulty names encoded as small ints for the session answer keys;
+# unknown difficulties are stored as "easy"
+_DIFFICULTY_NAMES: tuple[str, ...] = tuple(DIFFICULTY_POINTS)
+_DIFFICULTY_CODES: dict[str, int] = {name: i for i, name in enumerate(_DIFFICULTY_NAMES)}
+_DIFFICULTY_POINTS_BY_CODE: tuple[int, ...] = tuple(DIFFICULTY_POINTS[name] for name in _DIFFICULTY_NAMES)
+
+# Difficulty modes that select questions of a single level
+_DIFFICULTY_SET: frozenset[str] = frozenset(DIFFICULTY_POINTS)
+
+# Display names for category slugs
+_CATEGORY_DISPLAY: dict[str, str] = {
+    "ancient-civilizations": "Ancient Civilizations",
+    "medieval-europe": "Medieval Europe",
+    "world-wars": "World Wars",
+    "cold-war": "Cold War",
+    "ancient-philosophy": "Ancient Philosophy",
+    "revolutionary-periods": "Revolutionary Periods",
+    "science": "Science"
+}
+
+# Cookie identifying a single-player game's answer key
+SESSION_COOKIE = "game_session"
+
+# Seconds a single-player answer key is kept after the game starts
+_SESSION_TTL: float = 2 * 60 * 60
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Minimum seconds between sweeps for expired answer keys
+_REAP_INTERVAL: float = 60.0
 
-app = FastAPI(title="BrainRace")
+
+@dataclass(slots=True)
+class SessionQuestions:
+    """
+    Answer key for one single-player game, stored as parallel arrays.
+
+    Only what answer checking needs is kept server-side; the question
+    text and options are sent to the client and not retained.
+
+    Attributes:
+        correct: Correct option index per question.
+        difficulty: Difficulty code per question (see _DIFFICULTY_NAMES).
+        explanations: Fun-fact explanation per question.
+        expires_at: time.monotonic() deadline after which the key is dropped.
+    """
+    correct: array
+    difficulty: array
+    explanations: list[str]
+    expires_at: float
+
+
+@dataclass(slots=True)
+class RoomQuestions:
+    """
+    Questions for one room-based game, shared by every player in the room.
+
+    Holds the same parallel-array answer key as SessionQuestions, plus
+    the encoded question list that players fetch.
+
+    Attributes:
+        correct: Correct option index per question.
+        difficulty: Difficulty code per question (see _DIFFICULTY_NAMES).
+        explanations: Fun-fact explanation per question.
+        body: Pre-encoded /api/rooms/{code}/questions response, which
+            leaves out the correct answers.
+        expires_at: time.monotonic() deadline after which the entry is dropped.
+    """
+    correct: array
+    difficulty: array
+    explanations: list[str]
+    body: bytes
+    expires_at: float
+
+
+# Single-player answer keys, keyed by the game_session cookie
+_sessions: dict[str, SessionQuestions] = {}
+_next_reap: float = 0.0
+
+# Seconds a room's questions are kept; matches the rooms module's default expiry
+_ROOM_TTL: float = 24 * 60 * 60
+
+# Upper bound on rooms held in memory; the oldest are evicted first
+_MAX_ROOMS = 10_000
+
+# Questions for room-based games, keyed by room code. Entries are
+# inserted with a fixed TTL, so insertion order is expiry order.
+_room_questions: OrderedDict[str, RoomQuestions] = OrderedDict()
+
+app = FastAPI(title="BrainRace", default_response_class=ORJSONResponse)
 
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 
+@functools.lru_cache(maxsize=16)
+def _static_page(name: str) -> str:
+    """
+    Render a template that takes no per-request context, once.
+
+    Only for pages whose templates use neither request nor any other
+    context variable; their HTML is the same for every visitor.
+
+    Args:
+        name: Template file name within the templates directory.
+
+    Returns:
+        The rendered HTML.
+    """
+    return templates.get_template(name).render()
+
+
 # ============================================
 # AUTHENTICATION ROUTES
 # ============================================
@@ -55,7 +175,7 @@ async def login_page(request: Request) -> HTMLResponse:
     user = auth.get_user_from_session(session_token) if session_token else None
     if user:
         return RedirectResponse(url="/", status_code=302)
-    return templates.TemplateResponse("login.html", {"request": request})
+    return HTMLResponse(_static_page("login.html"))
 
 
 @app.post("/api/auth/register")
@@ -158,61 +278,165 @@ async def play(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: The rendered game.html template.
     """
-    return templates.TemplateResponse("game.html", {"request": request})
+    return HTMLResponse(_static_page("game.html"))
 
 
 @app.get("/api/questions")
 async def get_questions(
+    response: Response,
     count: int = 10,
-    categories: Optional[str] = None,
-    difficulty: str = "progressive"
-) -> dict[str, list[dict[str, Any]]]:
+    categories: Optional[List[str]] = Query(None),
+    difficulty: str = "progressive",
+    layout: str = Query("list", alias="format")
+) -> dict[str, list[Any]]:
     """
     Retrieve a set of trivia questions for a game session.
 
-    Questions are stored in memory for answer validation. The response
-    excludes correct answers to prevent cheating.
+    The answer key is stored server-side under a fresh game_session
+    cookie for answer validation. The response excludes correct answers
+    to prevent cheating.
 
     Args:
+        response: The outgoing response, used to set the session cookie.
         count: Number of questions to retrieve (default: 10).
-        categories: Comma-separated list of category IDs to filter by.
+        categories: Category IDs to filter by, as repeated query
+            parameters (?categories=a&categories=b). A single
+            comma-separated value is also accepted.
         difficulty: Difficulty mode - "progressive" (easy to hard),
             "easy", "medium", "hard", or "mixed" (random difficulties).
+        layout: Response shape, passed as ?format=. "list" (default)
+            returns one object per question; "soa" returns parallel
+            arrays, which avoids repeating the keys for every question.
 
     Returns:
-        A dictionary containing a list of questions, each with:
-        - id: Question identifier for answer checking
+        For "list", a dictionary containing a list of questions, each with:
+        - id: Question index within this game, for answer checking
         - category: The question's category
         - difficulty: The question's difficulty level
         - question: The question text
         - choices: List of answer options
+
+        For "soa", a dictionary with the same fields as parallel lists
+        under 'ids', 'categories', 'difficulties', 'questions' and 'choices'.
+    """
+    if categories and len(categories) == 1:
+        # A single value may be a comma-joined list from older clients
+        category_list = _parse_categories(categories[0])
+    else:
+        category_list = tuple(categories) if categories else None
+
+    questions = _pick_questions(count, category_list, difficulty)
+
+    # Keep only the answer key server-side
+    correct, difficulty_codes, explanations = _answer_key(questions)
+
+    if layout == "soa":
+        payload = {
+            "ids": list(range(len(questions))),
+            "categories": [q["category"] for q in questions],
+            "difficulties": [q["difficulty"] for q in questions],
+            "questions": [q["question"] for q in questions],
+            "choices": [q["options"] for q in questions]
+        }
+    else:
+        payload = {
+            "questions": [
+                {
+                    "id": idx,
+                    "category": q["category"],
+                    "difficulty": q["difficulty"],
+                    "question": q["question"],
+                    "choices": q["options"]
+                }
+                for idx, q in enumerate(questions)
+            ]
+        }
+
+    now = time.monotonic()
+    _reap_sessions(now)
+    session_id = uuid4().hex
+    _sessions[session_id] = SessionQuestions(
+        correct, difficulty_codes, explanations, now + _SESSION_TTL
+    )
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return payload
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_categories(raw: str) -> Optional[tuple[str, ...]]:
     """
-    # Parse categories from comma-separated string
-    category_list = None
-    if categories:
-        category_list = [c.strip() for c in categories.split(",") if c.strip()]
+    Split a comma-separated category filter into its slugs.
+
+    Clients send the same few filter strings over and over, so results
+    are cached; a tuple is returned so the cached value can't be mutated.
 
-    # Get questions based on difficulty mode
+    Args:
+        raw: Comma-separated category slugs, e.g. "world-wars,cold-war".
+
+    Returns:
+        The non-empty, stripped slugs, or None if there are none.
+    """
+    return tuple(c.strip() for c in raw.split(",") if c.strip()) or None
+
+
+def _pick_questions(
+    count: int,
+    categories: Optional[tuple[str, ...]],
+    difficulty: str
+) -> list[dict[str, Any]]:
+    """
+    Select questions for a game according to its difficulty mode.
+
+    Args:
+        count: Number of questions to select.
+        categories: Category slugs to draw from, or None for all.
+        difficulty: "progressive", a single level ("easy", "medium",
+            "hard"), or anything else for mixed.
+
+    Returns:
+        The selected question dicts, in play order.
+    """
     if difficulty == "progressive":
-        questions = question_bank.get_questions_progressive(count, category_list)
-    elif difficulty in ["easy", "medium", "hard"]:
-        questions = question_bank.get_questions_by_difficulty(count, category_list, difficulty)
-    else:  # mixed
-        questions = question_bank.get_questions_mixed(count, category_list)
-
-    # Store questions for answer checking and prepare safe response
-    safe_questions = []
-    for idx, q in enumerate(questions):
-        question_id = idx  # Use index as ID for this session
-        _active_questions[question_id] = q
-        safe_questions.append({
-            "id": question_id,
-            "category": q["category"],
-            "difficulty": q["difficulty"],
-            "question": q["question"],
-            "choices": q["options"]
-        })
-    return {"questions": safe_questions}
+        return question_bank.get_questions_progressive(count, categories)
+    if difficulty in _DIFFICULTY_SET:
+        return question_bank.get_questions_by_difficulty(count, categories, difficulty)
+    return question_bank.get_questions_mixed(count, categories)
+
+
+def _answer_key(questions: list[dict[str, Any]]) -> tuple[array, array, list[str]]:
+    """
+    Extract what answer checking needs from a list of questions.
+
+    Args:
+        questions: Question dicts in play order.
+
+    Returns:
+        A tuple of (correct option indices, difficulty codes, explanations),
+        as used by SessionQuestions and RoomQuestions.
+    """
+    correct = array("b", [q["correct_answer"] for q in questions])
+    difficulty_codes = array("b", [_DIFFICULTY_CODES.get(q["difficulty"], 0) for q in questions])
+    explanations = [q["explanation"] for q in questions]
+    return correct, difficulty_codes, explanations
+
+
+def _reap_sessions(now: float) -> None:
+    """
+    Drop expired single-player answer keys.
+
+    Sweeps at most once per _REAP_INTERVAL so the cost stays off the
+    common request path.
+
+    Args:
+        now: The current time.monotonic() value.
+    """
+    global _next_reap
+    if now < _next_reap:
+        return
+    _next_reap = now + _REAP_INTERVAL
+    expired = [sid for sid, sess in _sessions.items() if sess.expires_at <= now]
+    for sid in expired:
+        del _sessions[sid]
 
 
 @app.get("/api/categories")
@@ -224,40 +448,47 @@ async def get_categories() -> dict[str, list[dict[str, str]]]:
         A dictionary with a 'categories' key containing a list of category
         objects, each with 'id' (slug) and 'name' (display name) fields.
     """
-    categories = question_bank.get_categories()
-    # Return with display names
-    display_names = {
-        "ancient-civilizations": "Ancient Civilizations",
-        "medieval-europe": "Medieval Europe",
-        "world-wars": "World Wars",
-        "cold-war": "Cold War",
-        "ancient-philosophy": "Ancient Philosophy",
-        "revolutionary-periods": "Revolutionary Periods",
-        "science": "Science"
-    }
+    return _categories_response()
+
+
+@functools.lru_cache(maxsize=1)
+def _categories_response() -> dict[str, list[dict[str, str]]]:
+    """
+    Build the /api/categories payload once and reuse it.
+
+    The question bank is static while the app runs; call
+    _categories_response.cache_clear() if questions.json is reloaded.
+
+    Returns:
+        The categories response described in get_categories.
+    """
     return {
         "categories": [
-            {"id": cat, "name": display_names.get(cat, cat)}
-            for cat in categories
+            {"id": cat, "name": _CATEGORY_DISPLAY.get(cat, cat)}
+            for cat in question_bank.get_categories()
         ]
     }
 
 
-# Difficulty points for scoring
-DIFFICULTY_POINTS = {"easy": 10, "medium": 20, "hard": 30}
-
-
 @app.post("/api/check-answer", response_model=None)
 async def check_answer(
+    request: Request,
     question_id: int,
-    answer: int
+    answer: int,
+    room_code: Optional[str] = None
 ):
     """
     Validate a player's answer and return the result.
 
+    Room questions are looked up by room code and question index;
+    single-player questions in the answer key named by the game_session
+    cookie.
+
     Args:
+        request: The incoming HTTP request object.
         question_id: The ID of the question being answered.
         answer: The index (0-3) of the selected answer option.
+        room_code: The room the question belongs to, for room-based games.
 
     Returns:
         A dictionary containing:
@@ -269,18 +500,26 @@ async def check_answer(
 
         Returns 404 JSONResponse if question_id not found.
     """
-    question = _active_questions.get(question_id)
-    if not question:
+    key: Union[RoomQuestions, SessionQuestions, None]
+    if room_code:
+        key = _get_room_questions(room_code)
+    else:
+        key = _sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+    if key is None or not 0 <= question_id < len(key.correct):
         return JSONResponse({"error": "Question not found"}, status_code=404)
 
-    is_correct = answer == question["correct_answer"]
-    points = DIFFICULTY_POINTS.get(question["difficulty"], 10) if is_correct else 0
+    correct_answer = key.correct[question_id]
+    difficulty_code = key.difficulty[question_id]
+    fun_fact = key.explanations[question_id]
+
+    is_correct = answer == correct_answer
+    points = _DIFFICULTY_POINTS_BY_CODE[difficulty_code] if is_correct else 0
 
     return {
         "correct": is_correct,
-        "correct_answer": question["correct_answer"],
-        "fun_fact": question["explanation"],
-        "difficulty": question["difficulty"],
+        "correct_answer": correct_answer,
+        "fun_fact": fun_fact,
+        "difficulty": _DIFFICULTY_NAMES[difficulty_code],
         "points": points
     }
 
@@ -291,37 +530,24 @@ async def save_score(
     score: int,
     total_questions: int,
     category: Optional[str] = None,
-    difficulty: Optional[str] = None,
-    db: Session = Depends(get_db)
+    difficulty: Optional[str] = None
 ) -> dict[str, Any]:
     """
     Save a player's game score to the leaderboard.
 
-    Saves to both the legacy SQLAlchemy database and the new
-    leaderboard module for backwards compatibility.
-
     Args:
         player_name: The player's display name.
         score: The total score achieved.
         total_questions: Number of questions in the game.
         category: Optional category filter used in the game.
         difficulty: Optional difficulty setting used.
-        db: Database session (injected via FastAPI dependency).
 
     Returns:
         A dictionary with save result, including leaderboard rank if applicable.
     """
-    # Save to legacy database for backwards compatibility
-    new_score = Score(
-        player_name=player_name,
-        score=score,
-        total_questions=total_questions
-    )
-    db.add(new_score)
-    db.commit()
-
-    # Save to new leaderboard module
-    result = leaderboard.save_score(
+    # SQLite I/O runs in a worker thread so it doesn't block the event loop
+    result = await asyncio.to_thread(
+        leaderboard.save_score,
         player_name=player_name,
         score=score,
         category=category,
@@ -331,17 +557,26 @@ async def save_score(
     return result
 
 
-@app.get("/api/leaderboard")
-async def get_leaderboard() -> dict[str, list[dict[str, Any]]]:
+@app.get("/api/leaderboard", response_model=None)
+async def get_leaderboard(request: Request):
     """
     Retrieve the top 10 scores from the leaderboard.
 
+    The response carries an ETag; a request whose If-None-Match header
+    matches it gets an empty 304 so the browser reuses its copy.
+
+    Args:
+        request: The incoming HTTP request object.
+
     Returns:
-        A dictionary with a 'scores' key containing a list of score
+        A JSON Response with a 'scores' key containing a list of score
         records, each including player name, score, date, and game settings.
+        Returns 304 Response if the client's cached copy is current.
     """
-    scores = leaderboard.get_top_scores(10)
-    return {"scores": scores}
+    body, etag = await asyncio.to_thread(leaderboard.get_top_scores_json, 10)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/leaderboard", response_class=HTMLResponse)
@@ -355,7 +590,7 @@ async def leaderboard_page(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: The rendered leaderboard.html template with scores data.
     """
-    scores = leaderboard.get_top_scores(10)
+    scores = await asyncio.to_thread(leaderboard.get_top_scores, 10)
     return templates.TemplateResponse(
         "leaderboard.html",
         {"request": request, "scores": scores}
@@ -376,7 +611,7 @@ async def results_page(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: The rendered results.html template.
     """
-    return templates.TemplateResponse("results.html", {"request": request})
+    return HTMLResponse(_static_page("results.html"))
 
 
 # ============================================
@@ -397,7 +632,7 @@ async def lobby_page(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: The rendered lobby.html template.
     """
-    return templates.TemplateResponse("lobby.html", {"request": request})
+    return HTMLResponse(_static_page("lobby.html"))
 
 
 @app.post("/api/rooms/create")
@@ -422,37 +657,73 @@ async def create_room(
     Returns:
         A dictionary with room creation result including the room_code.
     """
-    # Parse categories
-    category_list = None
-    if categories:
-        category_list = [c.strip() for c in categories.split(",") if c.strip()]
-
-    # Get questions based on difficulty mode
-    if difficulty == "progressive":
-        questions = question_bank.get_questions_progressive(question_count, category_list)
-    elif difficulty in ["easy", "medium", "hard"]:
-        questions = question_bank.get_questions_by_difficulty(question_count, category_list, difficulty)
-    else:
-        questions = question_bank.get_questions_mixed(question_count, category_list)
+    category_list = _parse_categories(categories) if categories else None
 
-    # Store questions and get their indices
-    question_ids = []
-    for idx, q in enumerate(questions):
-        q_id = len(_active_questions) + idx + 1000  # Offset to avoid collision
-        _active_questions[q_id] = q
-        question_ids.append(q_id)
+    questions = _pick_questions(question_count, category_list, difficulty)
 
-    # Create room
+    # Question IDs are indices into the room's question list
     result = rooms.create_room(
         host_name=host_name,
-        question_ids=question_ids,
+        question_ids=list(range(len(questions))),
         categories=categories,
         difficulty=difficulty
     )
+    _store_room_questions(result["room_code"], questions)
 
     return result
 
 
+def _store_room_questions(room_code: str, questions: list[dict[str, Any]]) -> None:
+    """
+    Keep a room's questions in memory for answer checking.
+
+    The questions are immutable for the room's lifetime, so the public
+    question list is built and encoded here once. Expired entries are
+    dropped from the front of the store, and the oldest rooms are evicted
+    once it holds more than _MAX_ROOMS.
+
+    Args:
+        room_code: The room the questions belong to.
+        questions: The room's questions, in play order.
+    """
+    body = orjson.dumps({
+        "questions": [
+            {
+                "id": idx,
+                "category": q["category"],
+                "difficulty": q["difficulty"],
+                "question": q["question"],
+                "choices": q["options"]
+            }
+            for idx, q in enumerate(questions)
+        ]
+    })
+
+    now = time.monotonic()
+    while _room_questions:
+        oldest = next(iter(_room_questions.values()))
+        if oldest.expires_at > now and len(_room_questions) < _MAX_ROOMS:
+            break
+        _room_questions.popitem(last=False)
+    _room_questions[room_code] = RoomQuestions(*_answer_key(questions), body, now + _ROOM_TTL)
+
+
+def _get_room_questions(room_code: str) -> Optional[RoomQuestions]:
+    """
+    Look up the questions stored for a room.
+
+    Args:
+        room_code: The room code (case-insensitive).
+
+    Returns:
+        The room's RoomQuestions, or None if unknown or expired.
+    """
+    entry = _room_questions.get(room_code.upper())
+    if entry is None or entry.expires_at <= time.monotonic():
+        return None
+    return entry
+
+
 @app.post("/api/rooms/join")
 async def join_room(room_code: str, player_name: str) -> dict[str, Any]:
     """
@@ -513,20 +784,11 @@ async def get_room_questions(
     if not room:
         return JSONResponse({"error": "Room not found or expired"}, status_code=404)
 
-    # Get questions from memory
-    safe_questions = []
-    for q_id in room["question_ids"]:
-        q = _active_questions.get(q_id)
-        if q:
-            safe_questions.append({
-                "id": q_id,
-                "category": q["category"],
-                "difficulty": q["difficulty"],
-                "question": q["question"],
-                "choices": q["options"]
-            })
-
-    return {"questions": safe_questions}
+    # Serve the list encoded when the room was created
+    entry = _get_room_questions(room_code)
+    if entry is None:
+        return {"questions": []}
+    return Response(content=entry.body, media_type="application/json")
 
 
 @app.post("/api/rooms/{room_code}/score")
@@ -659,7 +921,7 @@ async def realtime_lobby_page(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: The rendered realtime-lobby.html template.
     """
-    return templates.TemplateResponse("realtime-lobby.html", {"request": request})
+    return HTMLResponse(_static_page("realtime-lobby.html"))
 
 
 @app.get("/realtime/{room_code}", response_class=HTMLResponse)
@@ -706,39 +968,30 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str, player_name:
         if room_code == "create":
             # Creating a new room
             # Get settings from first message
-            data = await websocket.receive_json()
+            data = await manager.receive_json(websocket)
             categories = data.get("categories", "")
             difficulty = data.get("difficulty", "progressive")
 
-            # Get questions
-            category_list = [c.strip() for c in categories.split(",") if c.strip()] if categories else None
-
-            if difficulty == "progressive":
-                questions = question_bank.get_questions_progressive(10, category_list)
-            elif difficulty in ["easy", "medium", "hard"]:
-                questions = question_bank.get_questions_by_difficulty(10, category_list, difficulty)
-            else:
-                questions = question_bank.get_questions_mixed(10, category_list)
-
-            # Store questions
-            question_ids = []
-            for idx, q in enumerate(questions):
-                q_id = len(_active_questions) + idx + 5000
-                _active_questions[q_id] = q
-                question_ids.append(q_id)
+            # Get questions off the event loop; the first call per process
+            # loads and parses questions.json
+            category_list = _parse_categories(categories) if categories else None
+            questions = await asyncio.to_thread(
+                _pick_questions, 10, category_list, difficulty
+            )
 
-            # Create room
+            # Create room; the manager checks answers itself, so
+            # question IDs are just indices into the room's questions
             room = await manager.create_room(
                 host_name=player_name,
                 websocket=websocket,
                 questions=questions,
-                question_ids=question_ids,
+                question_ids=range(len(questions)),
                 categories=categories,
                 difficulty=difficulty
             )
 
-            await websocket.send_json({
-                "type": "room_created",
+            await manager.send_json(websocket, {
+                "t": MessageType.ROOM_CREATED,
                 "room_code": room.code,
                 "players": manager._get_player_list(room)
             })
@@ -750,30 +1003,38 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str, player_name:
             room = await manager.join_room(room_code, player_name, websocket)
 
             if not room:
-                await websocket.send_json({
-                    "type": "error",
+                await manager.send_json(websocket, {
+                    "t": MessageType.ERROR,
                     "message": "Room not found or game already started"
                 })
                 await websocket.close()
                 return
 
-            await websocket.send_json({
-                "type": "room_joined",
+            # The joiner and everyone else get the same snapshot of the room
+            players = manager._get_player_list(room)
+            await manager.send_json(websocket, {
+                "t": MessageType.ROOM_JOINED,
                 "room_code": room.code,
                 "host": room.host_name,
-                "players": manager._get_player_list(room)
+                "players": players
             })
 
             # Notify others
             await manager.broadcast_to_room(room_code, {
-                "type": "player_joined",
+                "t": MessageType.PLAYER_JOINED,
                 "player": player_name,
-                "players": manager._get_player_list(room)
+                "players": players
             })
 
+        # Chat frames differ only in the message text, so encode the
+        # rest once and splice each message in before the closing brace
+        chat_prefix = orjson.dumps({
+            "t": MessageType.CHAT, "player": player_name, "message": None
+        }).decode()[:-5]
+
         # Main message loop
         while True:
-            data = await websocket.receive_json()
+            data = await manager.receive_json(websocket)
             msg_type = data.get("type")
 
             if msg_type == "start_game":
@@ -788,19 +1049,31 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str, player_name:
 
             elif msg_type == "chat":
                 message = data.get("message", "")[:200]  # Limit message length
-                await manager.broadcast_to_room(room_code, {
-                    "type": "chat",
-                    "player": player_name,
-                    "message": message
-                })
+                await manager.broadcast_to_room(
+                    room_code, chat_prefix + orjson.dumps(message).decode() + "}"
+                )
 
     except WebSocketDisconnect:
         await manager.leave_room(player_name)
-    except Exception as e:
-        print(f"WebSocket error: {e}")
+    except Exception:
+        logger.exception("WebSocket error room=%s player=%s", room_code, player_name)
         await manager.leave_room(player_name)
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools are installed by uvicorn[standard]; uvloop
+    # does not support Windows, which keeps the default asyncio loop
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        # Reject oversized frames in the protocol layer, before they are buffered
+        ws_max_size=MAX_MESSAGE_SIZE,
+        # Rooms and sessions live in process memory; see README
+        workers=1
+    )
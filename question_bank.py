@@ -12,12 +12,30 @@ The question bank reads from questions.json which contains questions
 organized by category and difficulty level.
 """
 
-import json
+import functools
+import itertools
 import random
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
+import orjson
 
+# Category slugs, in display order
+_CATEGORIES: tuple[str, ...] = (
+    "ancient-civilizations",
+    "medieval-europe",
+    "world-wars",
+    "cold-war",
+    "ancient-philosophy",
+    "revolutionary-periods",
+    "science"
+)
+
+# Difficulty levels, easiest first
+_DIFFICULTIES: tuple[str, ...] = ("easy", "medium", "hard")
+
+
+@functools.lru_cache(maxsize=1)
 def _load_questions_from_file() -> dict[str, dict[str, list[dict[str, Any]]]]:
     """
     Load raw question data from the JSON file.
@@ -25,13 +43,15 @@ def _load_questions_from_file() -> dict[str, dict[str, list[dict[str, Any]]]]:
     The JSON file contains questions organized in a nested structure:
     {category: {difficulty: [questions]}}
 
+    The file does not change while the app runs, so it is read and
+    parsed once; later calls return the same (unmodified) structure.
+
     Returns:
         A nested dictionary with categories as top-level keys,
         difficulties as second-level keys, and lists of questions as values.
     """
     questions_path = Path(__file__).parent / "questions.json"
-    with open(questions_path, "r") as f:
-        return json.load(f)
+    return orjson.loads(questions_path.read_bytes())
 
 
 def _flatten_questions(
@@ -83,6 +103,59 @@ def _flatten_questions(
     return questions
 
 
+@functools.lru_cache(maxsize=1)
+def _grouped_questions() -> dict[tuple[str, str], tuple[dict[str, Any], ...]]:
+    """
+    Flatten the whole question bank once, grouped by (category, difficulty).
+
+    Each question is augmented with its category and difficulty here,
+    once, and the same dict is then shared by every pool containing it.
+
+    Returns:
+        A dictionary mapping (category, difficulty) to that group's
+        questions, in file order.
+    """
+    data = _load_questions_from_file()
+    return {
+        (cat, diff): tuple({"category": cat, "difficulty": diff, **q} for q in questions)
+        for cat, by_difficulty in data.items()
+        for diff, questions in by_difficulty.items()
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _question_pool(
+    categories: Optional[frozenset[str]],
+    difficulty: Optional[str]
+) -> tuple[dict[str, Any], ...]:
+    """
+    Collect the questions matching a filter, once per filter.
+
+    The question bank does not change while the app runs, so only the
+    random selection needs to happen per call. Pools are assembled from
+    the precomputed groups; the pooled question dicts are shared between
+    callers and must not be mutated.
+
+    Args:
+        categories: Category slugs to include, or None for all.
+        difficulty: Difficulty level to include, or None for all.
+
+    Returns:
+        The matching questions as a tuple, in file order.
+    """
+    return tuple(
+        q
+        for (cat, diff), group in _grouped_questions().items()
+        if (not categories or cat in categories) and (not difficulty or diff == difficulty)
+        for q in group
+    )
+
+
+def _pool_key(categories: Optional[Sequence[str]]) -> Optional[frozenset[str]]:
+    """Normalize a category filter so any order of the same slugs shares a pool."""
+    return frozenset(categories) if categories else None
+
+
 def get_questions(
     count: int = 10,
     category: Optional[str] = None,
@@ -123,7 +196,7 @@ def get_questions(
 
 def get_questions_progressive(
     count: int = 10,
-    categories: Optional[list[str]] = None
+    categories: Optional[Sequence[str]] = None
 ) -> list[dict[str, Any]]:
     """
     Get questions with progressive difficulty (easy -> medium -> hard).
@@ -140,47 +213,35 @@ def get_questions_progressive(
         A list of question dictionaries ordered by difficulty:
         easy questions first, then medium, then hard.
     """
-    data = _load_questions_from_file()
-
-    # Filter by categories
-    if categories:
-        filtered_data = {k: v for k, v in data.items() if k in categories}
-    else:
-        filtered_data = data
-
-    # Collect questions by difficulty
-    easy_questions = _flatten_questions(filtered_data, difficulty="easy")
-    medium_questions = _flatten_questions(filtered_data, difficulty="medium")
-    hard_questions = _flatten_questions(filtered_data, difficulty="hard")
-
-    # Shuffle within each difficulty
-    random.shuffle(easy_questions)
-    random.shuffle(medium_questions)
-    random.shuffle(hard_questions)
+    key = _pool_key(categories)
+    easy_pool = _question_pool(key, "easy")
+    medium_pool = _question_pool(key, "medium")
+    hard_pool = _question_pool(key, "hard")
 
     # Calculate distribution: roughly 1/3 each, but adjust based on count
     easy_count = count // 3
     medium_count = count // 3
     hard_count = count - easy_count - medium_count
 
-    # Take questions from each pool (or all if not enough)
-    selected_easy = easy_questions[:min(easy_count, len(easy_questions))]
-    selected_medium = medium_questions[:min(medium_count, len(medium_questions))]
-    selected_hard = hard_questions[:min(hard_count, len(hard_questions))]
+    # Sample from each pool (or take all if not enough)
+    selected_easy = random.sample(easy_pool, max(0, min(easy_count, len(easy_pool))))
+    selected_medium = random.sample(medium_pool, max(0, min(medium_count, len(medium_pool))))
+    selected_hard = random.sample(hard_pool, max(0, min(hard_count, len(hard_pool))))
 
     # If we don't have enough in a category, fill from others
     total_selected = len(selected_easy) + len(selected_medium) + len(selected_hard)
     remaining = count - total_selected
 
     if remaining > 0:
-        # Try to fill with any remaining questions
-        all_remaining = (
-            easy_questions[len(selected_easy):] +
-            medium_questions[len(selected_medium):] +
-            hard_questions[len(selected_hard):]
-        )
-        random.shuffle(all_remaining)
-        extra = all_remaining[:remaining]
+        # Try to fill with any questions not already selected
+        chosen = {
+            id(q) for q in itertools.chain(selected_easy, selected_medium, selected_hard)
+        }
+        all_remaining = [
+            q for q in itertools.chain(easy_pool, medium_pool, hard_pool)
+            if id(q) not in chosen
+        ]
+        extra = random.sample(all_remaining, min(remaining, len(all_remaining)))
         # Sort extras by difficulty and append appropriately
         for q in extra:
             if q["difficulty"] == "easy":
@@ -196,7 +257,7 @@ def get_questions_progressive(
 
 def get_questions_by_difficulty(
     count: int = 10,
-    categories: Optional[list[str]] = None,
+    categories: Optional[Sequence[str]] = None,
     difficulty: str = "medium"
 ) -> list[dict[str, Any]]:
     """
@@ -214,23 +275,13 @@ def get_questions_by_difficulty(
         A list of question dictionaries, all at the specified difficulty.
         Questions are returned in random order within that difficulty.
     """
-    data = _load_questions_from_file()
-
-    # Filter by categories
-    if categories:
-        filtered_data = {k: v for k, v in data.items() if k in categories}
-    else:
-        filtered_data = data
-
-    questions = _flatten_questions(filtered_data, difficulty=difficulty)
-    random.shuffle(questions)
-
-    return questions[:min(count, len(questions))]
+    pool = _question_pool(_pool_key(categories), difficulty)
+    return random.sample(pool, max(0, min(count, len(pool))))
 
 
 def get_questions_mixed(
     count: int = 10,
-    categories: Optional[list[str]] = None
+    categories: Optional[Sequence[str]] = None
 ) -> list[dict[str, Any]]:
     """
     Get questions with random mixed difficulties.
@@ -246,21 +297,11 @@ def get_questions_mixed(
     Returns:
         A list of question dictionaries with randomly mixed difficulties.
     """
-    data = _load_questions_from_file()
-
-    # Filter by categories
-    if categories:
-        filtered_data = {k: v for k, v in data.items() if k in categories}
-    else:
-        filtered_data = data
+    pool = _question_pool(_pool_key(categories), None)
+    return random.sample(pool, max(0, min(count, len(pool))))
 
-    questions = _flatten_questions(filtered_data)
-    random.shuffle(questions)
 
-    return questions[:min(count, len(questions))]
-
-
-def get_categories() -> list[str]:
+def get_categories() -> tuple[str, ...]:
     """
     Return all available question category slugs.
 
@@ -269,20 +310,12 @@ def get_categories() -> list[str]:
     functions to filter results.
 
     Returns:
-        A list of category slug strings.
+        A tuple of category slug strings (the same object on every call).
     """
-    return [
-        "ancient-civilizations",
-        "medieval-europe",
-        "world-wars",
-        "cold-war",
-        "ancient-philosophy",
-        "revolutionary-periods",
-        "science"
-    ]
-
-
-def get_difficulties() -> list[str]:
+    return _CATEGORIES
+
+
+def get_difficulties() -> tuple[str, ...]:
     """
     Return all available difficulty levels.
 
@@ -290,6 +323,6 @@ def get_difficulties() -> list[str]:
     scoring in the game engine.
 
     Returns:
-        A list of difficulty level strings: 'easy', 'medium', 'hard'.
+        A tuple of difficulty level strings: 'easy', 'medium', 'hard'.
     """
-    return ["easy", "medium", "hard"]
+    return _DIFFICULTIES
@@ -1,4 +1,7 @@
-QUESTIONS = [
+import random
+from typing import Any
+
+QUESTIONS: list[dict[str, Any]] = [
     # ANCIENT HISTORY
     {
         "id": 1,
@@ -151,14 +154,18 @@ QUESTIONS = [
 ]
 
 
+# Questions grouped by era once, so era lookups don't rescan the list
+_BY_ERA: dict[str, list[dict[str, Any]]] = {}
+for _q in QUESTIONS:
+    _BY_ERA.setdefault(_q["era"], []).append(_q)
+del _q
+
+
 def get_questions_by_era(era: str = None):
     if era:
-        return [q for q in QUESTIONS if q["era"] == era]
+        return list(_BY_ERA.get(era, ()))
     return QUESTIONS
 
 
 def get_random_questions(count: int = 10):
-    import random
-    questions = QUESTIONS.copy()
-    random.shuffle(questions)
-    return questions[:count]
+    return random.sample(QUESTIONS, max(0, min(count, len(QUESTIONS))))
@@ -18,32 +18,214 @@ This is distinct from the WebSocket-based real-time multiplayer,
 which uses the websocket_manager module for live synchronized games.
 """
 
+import queue
 import sqlite3
 import json
+import logging
 import random
 import string
-from datetime import datetime, timedelta
-from typing import Optional, Any
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Any
+
+logger = logging.getLogger(__name__)
 
 # Path to the SQLite database file (shared with leaderboard)
 DATABASE_PATH: str = "leaderboard.db"
 
+# Seconds between background sweeps for expired rooms
+_CLEANUP_INTERVAL: float = 300.0
+
+# Most rooms a single background sweep deletes, to bound its write lock
+_CLEANUP_BATCH: int = 1000
+
+# Name of the background sweeper thread, used to find a running one
+_CLEANUP_THREAD_NAME: str = "rooms-cleanup"
+
+# Alphabet for shareable room codes
+_CODE_CHARS: str = string.ascii_uppercase + string.digits
+
+# Attempts at drawing an unused room code before giving up
+_CODE_ATTEMPTS: int = 10
+
+# SQLite's message when a drawn room code is already taken
+_CODE_COLLISION: str = "UNIQUE constraint failed: rooms.room_code"
+
+# Display format for timestamps returned to callers
+_TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+# Table schemas; timestamps are stored as unix epoch seconds
+_CREATE_ROOMS_SQL: str = """
+    CREATE TABLE IF NOT EXISTS rooms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        room_code TEXT UNIQUE NOT NULL,
+        created_at INTEGER NOT NULL,
+        expires_at INTEGER NOT NULL,
+        host_name TEXT NOT NULL,
+        categories TEXT,
+        difficulty TEXT,
+        question_ids BLOB NOT NULL,
+        status TEXT DEFAULT 'waiting'
+    )
+"""
+
+_CREATE_PLAYERS_SQL: str = """
+    CREATE TABLE IF NOT EXISTS room_players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        room_id INTEGER NOT NULL,
+        player_name TEXT NOT NULL,
+        score INTEGER DEFAULT 0,
+        correct_count INTEGER DEFAULT 0,
+        best_streak INTEGER DEFAULT 0,
+        completed INTEGER DEFAULT 0,
+        completed_at INTEGER,
+        FOREIGN KEY (room_id) REFERENCES rooms(id),
+        UNIQUE(room_id, player_name)
+    )
+"""
+
+# Hot-path SQL, kept as constants so each statement text stays identical
+# across calls and is served from the pooled connection's statement cache
+_SQL_INSERT_ROOM: str = """
+    INSERT INTO rooms (room_code, created_at, expires_at, host_name, categories, difficulty, question_ids, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 'waiting')
+"""
+
+_SQL_INSERT_PLAYER: str = "INSERT INTO room_players (room_id, player_name) VALUES (?, ?)"
+
+# Expired rooms are filtered by an integer compare; timestamps are
+# formatted for display on the way out
+_SQL_GET_ROOM: str = """
+    SELECT id, room_code,
+           strftime('%Y-%m-%d %H:%M:%S', created_at, 'unixepoch', 'localtime') AS created_at,
+           strftime('%Y-%m-%d %H:%M:%S', expires_at, 'unixepoch', 'localtime') AS expires_at,
+           host_name, categories, difficulty, question_ids, status,
+           rooms.expires_at AS expires_ts
+    FROM rooms WHERE room_code = ? AND rooms.expires_at > ?
+"""
+
+# Also closes the race where two joins with one name both see no row
+_SQL_JOIN_PLAYER: str = """
+    INSERT INTO room_players (room_id, player_name) VALUES (?, ?)
+    ON CONFLICT (room_id, player_name) DO NOTHING
+    RETURNING id
+"""
+
+_SQL_GET_PLAYER: str = "SELECT completed FROM room_players WHERE room_id = ? AND player_name = ?"
+
+# position is each player's 1-based place, numbered by SQLite in the
+# same index order the rows are returned in
+_SQL_LIST_PLAYERS: str = """
+    SELECT player_name, score, correct_count, best_streak, completed,
+           strftime('%Y-%m-%d %H:%M:%S', completed_at, 'unixepoch', 'localtime') AS completed_at,
+           ROW_NUMBER() OVER (ORDER BY score DESC, room_players.completed_at ASC) AS position
+    FROM room_players WHERE room_id = ?
+    ORDER BY score DESC, room_players.completed_at ASC
+"""
+
+# Players ahead of a just-saved score, in standings order: higher scores,
+# then equal scores unfinished (NULLs sort first) or finished earlier.
+# Players tied on score and finish second share the better rank.
+_SQL_RANK_IN_ROOM: str = """
+    SELECT COUNT(*) + 1 FROM room_players
+    WHERE room_id = ?
+      AND (score > ? OR (score = ? AND (completed_at IS NULL OR completed_at < ?)))
+"""
+
+_SQL_UPDATE_SCORE: str = """
+    UPDATE room_players
+    SET score = ?, correct_count = ?, best_streak = ?, completed = 1, completed_at = ?
+    WHERE room_id = ? AND player_name = ?
+"""
+
+# Oldest expired rooms first (ties by id); LIMIT -1 means no limit. The
+# deleted ids are returned so players are removed for exactly those rooms.
+_SQL_CLEANUP_ROOMS: str = """
+    DELETE FROM rooms WHERE id IN (
+        SELECT id FROM rooms WHERE expires_at < ? ORDER BY expires_at, id LIMIT ?
+    )
+    RETURNING id
+"""
+
+_SQL_CLEANUP_PLAYERS: str = "DELETE FROM room_players WHERE room_id = ?"
+
+# Maximum number of rooms kept in the lookup cache
+_ROOM_CACHE_SIZE: int = 1024
+
+# (database path, room code) -> (expires_at epoch, room details). Room rows
+# are never updated after creation, so entries only go stale by expiring.
+_room_cache: dict[tuple[str, str], tuple[int, dict[str, Any]]] = {}
+_room_cache_lock = threading.Lock()
+
+# Maximum number of idle connections kept for reuse
+_POOL_SIZE: int = 8
+
+# Idle (path, connection) pairs; LIFO so the warmest connection is reused first
+_POOL: "queue.LifoQueue[tuple[str, sqlite3.Connection]]" = queue.LifoQueue(maxsize=_POOL_SIZE)
+
 
 def _get_connection() -> sqlite3.Connection:
     """
     Create and return a SQLite database connection.
 
     The connection is configured with sqlite3.Row as the row factory,
-    enabling dict-like access to query results.
+    enabling dict-like access to query results, and with the same
+    per-connection PRAGMAs as the leaderboard connections. It may be
+    shared across threads, so it can be parked in the connection pool
+    between requests.
 
     Returns:
         A sqlite3.Connection object ready for queries.
     """
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # Wait for a concurrent writer instead of raising "database is locked"
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a pooled connection for the duration of a with-block.
+
+    Reuses an idle connection when one is available for the current
+    DATABASE_PATH, otherwise opens a new one. The connection is returned
+    to the pool afterwards, or closed if the pool is full, the database
+    path has changed, or a transaction was left open.
+
+    Yields:
+        A sqlite3.Connection object ready for queries.
+    """
+    path = DATABASE_PATH
+    while True:
+        try:
+            pooled_path, conn = _POOL.get_nowait()
+        except queue.Empty:
+            conn = _get_connection()
+            break
+        if pooled_path == path:
+            break
+        conn.close()
+
+    try:
+        yield conn
+    finally:
+        if path != DATABASE_PATH or conn.in_transaction:
+            conn.close()
+        else:
+            try:
+                _POOL.put_nowait((path, conn))
+            except queue.Full:
+                conn.close()
+
+
 def init_rooms_db() -> None:
     """
     Initialize the rooms database tables.
@@ -53,55 +235,118 @@ def init_rooms_db() -> None:
     1. rooms: Stores room metadata
        - id: Auto-incrementing primary key
        - room_code: Unique shareable code (e.g., 'ABC123')
-       - created_at/expires_at: Timestamps for lifecycle management
+       - created_at/expires_at: Unix timestamps for lifecycle management
        - host_name: Creator's display name
        - categories/difficulty: Game settings
-       - question_ids: JSON array of question IDs
+       - question_ids: Question IDs packed as little-endian uint16s
+         (JSON text in rooms created before the switch)
        - status: Room state ('waiting', 'playing', etc.)
 
     2. room_players: Stores player data within rooms
        - Links to room via room_id foreign key
        - Tracks score, correct count, streak
-       - completion status and timestamp
+       - completion status and unix timestamp
+
+    Databases created with the older TEXT timestamp columns are migrated
+    in place. Indexes on expires_at and on (room_id, score, completed_at)
+    let expiry cleanup and room standings avoid full scans and sorts. The
+    database is switched to write-ahead logging so room reads are not
+    blocked while a score is being saved.
 
     This function is called automatically on module import.
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    with _connection() as conn:
+        cursor = conn.cursor()
+
+        # Journal mode is persistent, so it only needs to be set once
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        _migrate_text_timestamps(conn)
+        cursor.execute(_CREATE_ROOMS_SQL)
+        cursor.execute(_CREATE_PLAYERS_SQL)
+
+        # room_code and (room_id, player_name) are already indexed by their
+        # UNIQUE constraints; these cover the cleanup scan and room standings
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rooms_expires ON rooms(expires_at)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_players_room_score
+            ON room_players(room_id, score DESC, completed_at ASC)
+        """)
 
-    # Rooms table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS rooms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            room_code TEXT UNIQUE NOT NULL,
-            created_at TEXT NOT NULL,
-            expires_at TEXT NOT NULL,
-            host_name TEXT NOT NULL,
-            categories TEXT,
-            difficulty TEXT,
-            question_ids TEXT NOT NULL,
-            status TEXT DEFAULT 'waiting'
-        )
-    """)
-
-    # Room players table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS room_players (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            room_id INTEGER NOT NULL,
-            player_name TEXT NOT NULL,
-            score INTEGER DEFAULT 0,
-            correct_count INTEGER DEFAULT 0,
-            best_streak INTEGER DEFAULT 0,
-            completed INTEGER DEFAULT 0,
-            completed_at TEXT,
-            FOREIGN KEY (room_id) REFERENCES rooms(id),
-            UNIQUE(room_id, player_name)
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+        conn.commit()
+
+
+def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+    """
+    Convert legacy TEXT timestamp columns to unix epoch seconds.
+
+    Older databases stored room and player timestamps as local-time
+    "YYYY-MM-DD HH:MM:SS" strings. Both tables are rebuilt with INTEGER
+    columns and existing rows are converted; their indexes are recreated
+    by init_rooms_db afterwards.
+
+    Args:
+        conn: An open rooms connection with no transaction in progress.
+    """
+    columns = {row["name"]: row["type"] for row in conn.execute("PRAGMA table_info(rooms)")}
+    if columns.get("expires_at", "").upper() != "TEXT":
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("ALTER TABLE room_players RENAME TO room_players_legacy")
+        conn.execute("ALTER TABLE rooms RENAME TO rooms_legacy")
+        conn.execute(_CREATE_ROOMS_SQL)
+        conn.execute(_CREATE_PLAYERS_SQL)
+        conn.execute("""
+            INSERT INTO rooms (id, room_code, created_at, expires_at, host_name, categories, difficulty, question_ids, status)
+            SELECT id, room_code, CAST(strftime('%s', created_at, 'utc') AS INTEGER),
+                   CAST(strftime('%s', expires_at, 'utc') AS INTEGER),
+                   host_name, categories, difficulty, question_ids, status
+            FROM rooms_legacy
+        """)
+        conn.execute("""
+            INSERT INTO room_players (id, room_id, player_name, score, correct_count, best_streak, completed, completed_at)
+            SELECT id, room_id, player_name, score, correct_count, best_streak, completed,
+                   CAST(strftime('%s', completed_at, 'utc') AS INTEGER)
+            FROM room_players_legacy
+        """)
+        conn.execute("DROP TABLE room_players_legacy")
+        conn.execute("DROP TABLE rooms_legacy")
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _pack_question_ids(question_ids: list[int]) -> bytes:
+    """
+    Pack question IDs into the compact BLOB stored on a room.
+
+    Args:
+        question_ids: Question IDs, each in the range 0-65535.
+
+    Returns:
+        The IDs as consecutive little-endian unsigned 16-bit integers.
+    """
+    return struct.pack(f"<{len(question_ids)}H", *question_ids)
+
+
+def _unpack_question_ids(stored: Any) -> list[int]:
+    """
+    Decode a room's stored question IDs.
+
+    Args:
+        stored: A packed BLOB, or JSON text from an older database.
+
+    Returns:
+        The question IDs as a list.
+    """
+    if isinstance(stored, bytes):
+        return list(struct.unpack(f"<{len(stored) // 2}H", stored))
+    return json.loads(stored)
 
 
 def _generate_room_code(length: int = 6) -> str:
@@ -109,8 +354,8 @@ def _generate_room_code(length: int = 6) -> str:
     Generate a random alphanumeric room code.
 
     Creates a code using uppercase letters and digits that players
-    can share to join the same room. Uniqueness is verified by the
-    caller (create_room function).
+    can share to join the same room. Uniqueness is enforced by the
+    rooms table; create_room retries on a collision.
 
     Args:
         length: Number of characters in the code (default 6).
@@ -118,8 +363,7 @@ def _generate_room_code(length: int = 6) -> str:
     Returns:
         A random string like 'ABC123' or 'XY7Z9W'.
     """
-    chars = string.ascii_uppercase + string.digits
-    return ''.join(random.choice(chars) for _ in range(length))
+    return ''.join(random.choices(_CODE_CHARS, k=length))
 
 
 def create_room(
@@ -138,7 +382,8 @@ def create_room(
 
     Args:
         host_name: Display name of the player creating the room.
-        question_ids: List of question IDs that all players will answer.
+        question_ids: List of question IDs that all players will answer;
+            each must fit in an unsigned 16-bit integer.
         categories: Comma-separated category filter string (for display).
         difficulty: Difficulty mode used (for display).
         expires_hours: Hours until the room expires (default 24).
@@ -150,49 +395,80 @@ def create_room(
         - room_id: Database ID of the room
         - expires_at: Timestamp when the room will expire
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    return create_rooms_bulk([{
+        "host_name": host_name,
+        "question_ids": question_ids,
+        "categories": categories,
+        "difficulty": difficulty,
+        "expires_hours": expires_hours
+    }])[0]
 
-    # Generate unique room code
-    room_code = _generate_room_code()
-    while True:
-        cursor.execute("SELECT id FROM rooms WHERE room_code = ?", (room_code,))
-        if not cursor.fetchone():
-            break
-        room_code = _generate_room_code()
-
-    created_at = datetime.now()
-    expires_at = created_at + timedelta(hours=expires_hours)
-
-    cursor.execute("""
-        INSERT INTO rooms (room_code, created_at, expires_at, host_name, categories, difficulty, question_ids, status)
-        VALUES (?, ?, ?, ?, ?, ?, ?, 'waiting')
-    """, (
-        room_code,
-        created_at.strftime("%Y-%m-%d %H:%M:%S"),
-        expires_at.strftime("%Y-%m-%d %H:%M:%S"),
-        host_name,
-        categories,
-        difficulty,
-        json.dumps(question_ids)
-    ))
-
-    room_id = cursor.lastrowid
-
-    # Add host as first player
-    cursor.execute("""
-        INSERT INTO room_players (room_id, player_name) VALUES (?, ?)
-    """, (room_id, host_name))
-
-    conn.commit()
-    conn.close()
 
-    return {
-        "success": True,
-        "room_code": room_code,
-        "room_id": room_id,
-        "expires_at": expires_at.strftime("%Y-%m-%d %H:%M:%S")
-    }
+def create_rooms_bulk(specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Create several rooms in a single transaction.
+
+    For seeding rooms ahead of time (e.g. tournaments): every room and
+    its host player is written on one connection and committed once,
+    instead of one commit per room.
+
+    Args:
+        specs: One dictionary per room with create_room's arguments as
+            keys; host_name and question_ids are required.
+
+    Returns:
+        A list of create_room result dictionaries, in the order of specs.
+    """
+    results = []
+    hosts = []
+    created_at = int(time.time())
+
+    with _connection() as conn:
+        cursor = conn.cursor()
+
+        for spec in specs:
+            expires_at = created_at + spec.get("expires_hours", 24) * 3600
+
+            # Let the UNIQUE constraint catch the rare duplicate code
+            # rather than checking for it up front on every create; any
+            # other constraint failure would fail again, so it propagates
+            for _ in range(_CODE_ATTEMPTS):
+                room_code = _generate_room_code()
+                try:
+                    cursor.execute(_SQL_INSERT_ROOM, (
+                        room_code,
+                        created_at,
+                        expires_at,
+                        spec["host_name"],
+                        spec.get("categories"),
+                        spec.get("difficulty"),
+                        _pack_question_ids(spec["question_ids"])
+                    ))
+                except sqlite3.IntegrityError as e:
+                    if _CODE_COLLISION not in str(e):
+                        raise
+                    continue
+                break
+            else:
+                raise sqlite3.IntegrityError(
+                    f"No free room code after {_CODE_ATTEMPTS} attempts"
+                )
+
+            room_id = cursor.lastrowid
+            hosts.append((room_id, spec["host_name"]))
+            results.append({
+                "success": True,
+                "room_code": room_code,
+                "room_id": room_id,
+                "expires_at": time.strftime(_TIME_FORMAT, time.localtime(expires_at))
+            })
+
+        # Add each host as their room's first player
+        cursor.executemany(_SQL_INSERT_PLAYER, hosts)
+
+        conn.commit()
+
+    return results
 
 
 def get_room(room_code: str) -> Optional[dict[str, Any]]:
@@ -212,31 +488,69 @@ def get_room(room_code: str) -> Optional[dict[str, Any]]:
         - created_at/expires_at: Timestamps
         - host_name: Creator's name
         - categories/difficulty: Game settings
-        - question_ids: List of question IDs (parsed from JSON)
+        - question_ids: List of question IDs
         - status: Current room status
 
         Returns None if the room doesn't exist or has expired.
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    room = _cached_room(room_code)
+    if room is not None:
+        return room
 
-    cursor.execute("""
-        SELECT id, room_code, created_at, expires_at, host_name, categories, difficulty, question_ids, status
-        FROM rooms WHERE room_code = ?
-    """, (room_code.upper(),))
+    with _connection() as conn:
+        return _fetch_room(conn, room_code)
 
-    row = cursor.fetchone()
-    conn.close()
 
-    if not row:
-        return None
+def _cached_room(room_code: str) -> Optional[dict[str, Any]]:
+    """
+    Return a room from the lookup cache if it is there and unexpired.
+
+    Args:
+        room_code: The room code, in any case.
+
+    Returns:
+        The cached room details, or None on a miss.
+    """
+    key = (DATABASE_PATH, room_code.upper())
+    with _room_cache_lock:
+        entry = _room_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] > time.time():
+            return entry[1]
+        del _room_cache[key]
+    return None
+
+
+def _fetch_room(conn: sqlite3.Connection, room_code: str) -> Optional[dict[str, Any]]:
+    """
+    Look up a room on an already borrowed connection.
 
-    # Check if expired
-    expires_at = datetime.strptime(row["expires_at"], "%Y-%m-%d %H:%M:%S")
-    if datetime.now() > expires_at:
+    Lets callers that go on to read or write player rows do the whole
+    operation on one connection; see get_room for the result format.
+    Rooms found are cached until they expire, so repeat lookups skip
+    SQLite; the returned dictionary is shared and must not be modified.
+
+    Args:
+        conn: An open rooms connection.
+        room_code: The room code, in any case.
+
+    Returns:
+        The room details dictionary, or None if missing or expired.
+    """
+    room = _cached_room(room_code)
+    if room is not None:
+        return room
+
+    key = (DATABASE_PATH, room_code.upper())
+    now = int(time.time())
+
+    row = conn.execute(_SQL_GET_ROOM, (key[1], now)).fetchone()
+
+    if not row:
         return None
 
-    return {
+    room = {
         "id": row["id"],
         "room_code": row["room_code"],
         "created_at": row["created_at"],
@@ -244,10 +558,17 @@ def get_room(room_code: str) -> Optional[dict[str, Any]]:
         "host_name": row["host_name"],
         "categories": row["categories"],
         "difficulty": row["difficulty"],
-        "question_ids": json.loads(row["question_ids"]),
+        "question_ids": _unpack_question_ids(row["question_ids"]),
         "status": row["status"]
     }
 
+    with _room_cache_lock:
+        if len(_room_cache) >= _ROOM_CACHE_SIZE:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del _room_cache[next(iter(_room_cache))]
+        _room_cache[key] = (row["expires_ts"], room)
+    return room
+
 
 def join_room(room_code: str, player_name: str) -> dict[str, Any]:
     """
@@ -268,35 +589,24 @@ def join_room(room_code: str, player_name: str) -> dict[str, Any]:
         - already_joined: Whether player was already in the room
         - already_completed: Whether player already finished the game
     """
-    room = get_room(room_code)
-    if not room:
-        return {"success": False, "error": "Room not found or expired"}
-
-    conn = _get_connection()
-    cursor = conn.cursor()
-
-    # Check if player already in room
-    cursor.execute("""
-        SELECT id, completed FROM room_players WHERE room_id = ? AND player_name = ?
-    """, (room["id"], player_name))
-
-    existing = cursor.fetchone()
-    if existing:
-        conn.close()
-        return {
-            "success": True,
-            "room": room,
-            "already_joined": True,
-            "already_completed": existing["completed"] == 1
-        }
-
-    # Add player to room
-    cursor.execute("""
-        INSERT INTO room_players (room_id, player_name) VALUES (?, ?)
-    """, (room["id"], player_name))
-
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        room = _fetch_room(conn, room_code)
+        if not room:
+            return {"success": False, "error": "Room not found or expired"}
+
+        # Add the player unless already present; RETURNING only yields a
+        # row for a new player, so a first join is a single statement
+        joined = conn.execute(_SQL_JOIN_PLAYER, (room["id"], player_name)).fetchone()
+        conn.commit()
+
+        if joined is None:
+            existing = conn.execute(_SQL_GET_PLAYER, (room["id"], player_name)).fetchone()
+            return {
+                "success": True,
+                "room": room,
+                "already_joined": True,
+                "already_completed": existing["completed"] == 1
+            }
 
     return {
         "success": True,
@@ -327,31 +637,50 @@ def get_room_players(room_code: str) -> list[dict[str, Any]]:
 
         Returns empty list if the room doesn't exist.
     """
-    room = get_room(room_code)
-    if not room:
-        return []
+    with _connection() as conn:
+        room = _fetch_room(conn, room_code)
+        if not room:
+            return []
+        return _fetch_players(conn, room["id"])[0]
+
+
+def _fetch_players(
+    conn: sqlite3.Connection,
+    room_id: int,
+    player_name: Optional[str] = None
+) -> tuple[list[dict[str, Any]], Optional[int]]:
+    """
+    Read a room's standings on an already borrowed connection.
 
-    conn = _get_connection()
-    cursor = conn.cursor()
+    Args:
+        conn: An open rooms connection.
+        room_id: Database ID of the room.
+        player_name: Player whose rank to pick out while reading, if any.
 
-    cursor.execute("""
-        SELECT player_name, score, correct_count, best_streak, completed, completed_at
-        FROM room_players WHERE room_id = ? ORDER BY score DESC, completed_at ASC
-    """, (room["id"],))
+    Returns:
+        A tuple of the player list in get_room_players format and order,
+        and player_name's rank (None if not given or not in the room).
+    """
+    # Plain tuples: rows are unpacked positionally, no sqlite3.Row lookups
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(_SQL_LIST_PLAYERS, (room_id,))
 
     players = []
-    for row in cursor.fetchall():
+    rank = None
+    for name, score, correct_count, best_streak, completed, completed_at, position in cursor:
+        if name == player_name:
+            rank = position
         players.append({
-            "player_name": row["player_name"],
-            "score": row["score"],
-            "correct_count": row["correct_count"],
-            "best_streak": row["best_streak"],
-            "completed": row["completed"] == 1,
-            "completed_at": row["completed_at"]
+            "player_name": name,
+            "score": score,
+            "correct_count": correct_count,
+            "best_streak": best_streak,
+            "completed": completed == 1,
+            "completed_at": completed_at
         })
 
-    conn.close()
-    return players
+    return players, rank
 
 
 def save_room_score(
@@ -382,29 +711,20 @@ def save_room_score(
         - rank: Player's position in the room standings
         - players: Full updated player list with scores
     """
-    room = get_room(room_code)
-    if not room:
-        return {"success": False, "error": "Room not found or expired"}
+    # Room lookup, update and standings share one connection and one commit
+    with _connection() as conn:
+        room = _fetch_room(conn, room_code)
+        if not room:
+            return {"success": False, "error": "Room not found or expired"}
 
-    conn = _get_connection()
-    cursor = conn.cursor()
-
-    completed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    cursor.execute("""
-        UPDATE room_players
-        SET score = ?, correct_count = ?, best_streak = ?, completed = 1, completed_at = ?
-        WHERE room_id = ? AND player_name = ?
-    """, (score, correct_count, best_streak, completed_at, room["id"], player_name))
+        completed_at = int(time.time())
 
-    conn.commit()
-    conn.close()
+        conn.execute(_SQL_UPDATE_SCORE, (score, correct_count, best_streak, completed_at, room["id"], player_name))
 
-    # Get updated standings
-    players = get_room_players(room_code)
+        # Get updated standings
+        players, rank = _fetch_players(conn, room["id"], player_name)
 
-    # Find player's rank
-    rank = next((i + 1 for i, p in enumerate(players) if p["player_name"] == player_name), None)
+        conn.commit()
 
     return {
         "success": True,
@@ -413,43 +733,112 @@ def save_room_score(
     }
 
 
-def cleanup_expired_rooms() -> int:
+def save_room_score_rank_only(
+    room_code: str,
+    player_name: str,
+    score: int,
+    correct_count: int,
+    best_streak: int
+) -> dict[str, Any]:
+    """
+    Save a player's final score and return only their rank.
+
+    Same update as save_room_score, for callers that don't need the
+    standings: the rank is counted from the standings index in SQL
+    rather than by reading every player in the room.
+
+    Args:
+        room_code: The room code.
+        player_name: The player's display name.
+        score: Total points achieved.
+        correct_count: Number of correct answers.
+        best_streak: Longest consecutive correct answer streak.
+
+    Returns:
+        A dictionary containing:
+        - success: Whether the save was successful
+        - error: Error message if success is False
+        - rank: Player's position in the room standings (None if the
+          player is not in the room)
+    """
+    with _connection() as conn:
+        room = _fetch_room(conn, room_code)
+        if not room:
+            return {"success": False, "error": "Room not found or expired"}
+
+        completed_at = int(time.time())
+
+        updated = conn.execute(
+            _SQL_UPDATE_SCORE,
+            (score, correct_count, best_streak, completed_at, room["id"], player_name)
+        ).rowcount
+        rank = None
+        if updated:
+            rank = conn.execute(
+                _SQL_RANK_IN_ROOM, (room["id"], score, score, completed_at)
+            ).fetchone()[0]
+
+        conn.commit()
+
+    return {"success": True, "rank": rank}
+
+
+def cleanup_expired_rooms(limit: Optional[int] = None) -> int:
     """
     Remove expired rooms and their associated player data.
 
     Deletes rooms that have passed their expiration time, along with
-    all player records for those rooms. This can be called periodically
-    to keep the database clean.
+    all player records for those rooms. This runs periodically in a
+    background thread (see start_cleanup_thread) and can also be called
+    directly.
+
+    Args:
+        limit: Most rooms to delete, oldest expiry first (default: all).
 
     Returns:
         The number of rooms that were deleted.
     """
-    conn = _get_connection()
-    cursor = conn.cursor()
+    now = int(time.time())
+    batch = -1 if limit is None else limit
 
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # The expires_at index drives the room subquery; both deletes commit together
+    with _connection() as conn:
+        room_ids = conn.execute(_SQL_CLEANUP_ROOMS, (now, batch)).fetchall()
+        conn.executemany(_SQL_CLEANUP_PLAYERS, room_ids)
+        conn.commit()
 
-    # Get expired room IDs
-    cursor.execute("SELECT id FROM rooms WHERE expires_at < ?", (now,))
-    expired_ids = [row["id"] for row in cursor.fetchall()]
+    with _room_cache_lock:
+        for key in [k for k, (expires_at, _) in _room_cache.items() if expires_at < now]:
+            del _room_cache[key]
 
-    if expired_ids:
-        # Delete players from expired rooms
-        cursor.execute(
-            f"DELETE FROM room_players WHERE room_id IN ({','.join('?' * len(expired_ids))})",
-            expired_ids
-        )
-        # Delete expired rooms
-        cursor.execute(
-            f"DELETE FROM rooms WHERE id IN ({','.join('?' * len(expired_ids))})",
-            expired_ids
-        )
+    return len(room_ids)
 
-    conn.commit()
-    conn.close()
 
-    return len(expired_ids)
+def _cleanup_loop() -> None:
+    """Sweep expired rooms every _CLEANUP_INTERVAL seconds, forever."""
+    while True:
+        time.sleep(_CLEANUP_INTERVAL)
+        try:
+            cleanup_expired_rooms(limit=_CLEANUP_BATCH)
+        except Exception:
+            # Keep sweeping; a dead sweeper would let expired rooms pile up
+            logger.exception("Expired room cleanup failed")
+
+
+def start_cleanup_thread() -> None:
+    """
+    Start the background sweeper for expired rooms.
+
+    Runs cleanup_expired_rooms in a daemon thread so requests never pay
+    for it. Does nothing if a sweeper is already alive in the process;
+    the check looks at running threads rather than a module flag, so it
+    also holds when the module is reloaded or imported again.
+    """
+    if any(t.name == _CLEANUP_THREAD_NAME and t.is_alive() for t in threading.enumerate()):
+        return
+    threading.Thread(target=_cleanup_loop, name=_CLEANUP_THREAD_NAME, daemon=True).start()
 
 
-# Initialize database on module import
+# Initialize database and start the expiry sweeper on module import
 init_rooms_db()
+start_cleanup_thread()
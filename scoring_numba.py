@@ -0,0 +1,94 @@
+"""
+Optional Numba-compiled batch scorer for BrainRace.
+
+This module replays whole games through the scoring rules in a single
+compiled call, for balance testing and Monte-Carlo simulation of streak
+bonuses where the pure-Python loop becomes the bottleneck. Features:
+- Difficulty names encoded once into a small int array
+- Streak multipliers passed as a per-streak-length lookup array
+- Transparent fallback to game_engine.replay_scores when numba or
+  numpy are not installed
+
+Numba is not a runtime dependency of the web app; install it with
+`pip install numba` to enable the compiled path.
+"""
+
+from typing import Sequence
+
+import game_engine
+from game_engine import STARTING_LIVES, replay_scores
+
+try:
+    import numpy as np
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    # Scoring tables from game_engine as arrays the kernel can index
+    _POINTS_ARRAY = np.array(game_engine._POINTS, dtype=np.int32)
+    _MULT_BY_STREAK = np.array(game_engine._MULT_BY_STREAK, dtype=np.float64)
+
+    @njit(cache=True)
+    def _score_game_kernel(difficulties, correct, points, mult_by_streak, starting_lives):
+        """Compiled equivalent of game_engine.replay_scores on encoded arrays."""
+        score = 0
+        streak = 0
+        max_streak = 0
+        lives = starting_lives
+
+        for i in range(difficulties.shape[0]):
+            if lives <= 0:
+                break
+            if correct[i]:
+                streak += 1
+                if streak > max_streak:
+                    max_streak = streak
+                multiplier = mult_by_streak[min(streak, mult_by_streak.shape[0] - 1)]
+                score += int(points[difficulties[i]] * multiplier)
+            else:
+                lives -= 1
+                streak = 0
+
+        return score, max_streak, lives
+
+    # Compile at import so the first real call does not pay the JIT cost
+    _score_game_kernel(
+        np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.bool_),
+        _POINTS_ARRAY, _MULT_BY_STREAK, STARTING_LIVES,
+    )
+
+
+def score_game(
+    difficulties: Sequence[str],
+    correct: Sequence[bool]
+) -> tuple[int, int, int]:
+    """
+    Score a full game of answers in one call.
+
+    Uses the compiled kernel when numba is available, otherwise falls
+    back to game_engine.replay_scores. Both paths apply the same points,
+    streak and lives rules as game_engine.submit_answer.
+
+    Args:
+        difficulties: Difficulty of each question, in play order.
+        correct: Whether each question was answered correctly.
+
+    Returns:
+        A tuple of (score, max_streak, lives_remaining).
+    """
+    if not _NUMBA_AVAILABLE:
+        return replay_scores(difficulties, correct)
+
+    n = min(len(difficulties), len(correct))
+    codes = np.fromiter(
+        (game_engine._DIFF_INDEX.get(d, 0) for d in difficulties[:n]),
+        dtype=np.int8, count=n,
+    )
+    answers = np.fromiter(correct[:n], dtype=np.bool_, count=n)
+    score, max_streak, lives = _score_game_kernel(
+        codes, answers, _POINTS_ARRAY, _MULT_BY_STREAK, STARTING_LIVES
+    )
+    return int(score), int(max_streak), int(lives)
@@ -3,6 +3,24 @@
 // WebSocket-based live gameplay
 // ============================================
 
+// Server message types (the "t" field); mirrors MessageType in websocket_manager.py
+const MT = Object.freeze({
+    ROOM_CREATED: 1,
+    ROOM_JOINED: 2,
+    PLAYER_JOINED: 3,
+    PLAYER_LEFT: 4,
+    PLAYER_ANSWERED: 5,
+    ERROR: 6,
+    ROOM_CLOSED: 7,
+    COUNTDOWN: 8,
+    GAME_START: 9,
+    QUESTION: 10,
+    TIMER: 11,
+    ANSWER_RESULT: 12,
+    GAME_OVER: 13,
+    CHAT: 14
+});
+
 class RealTimeGame {
     constructor() {
         this.playerName = sessionStorage.getItem('username') || 'Player';
@@ -113,17 +131,17 @@ class RealTimeGame {
     }
 
     handleMessage(data) {
-        console.log('Received:', data.type, data);
+        console.log('Received:', data.t, data);
 
-        switch (data.type) {
-            case 'room_created':
+        switch (data.t) {
+            case MT.ROOM_CREATED:
                 this.roomCode = data.room_code;
                 document.getElementById('display-room-code').textContent = data.room_code;
                 history.replaceState(null, '', `/realtime/${data.room_code}`);
                 this.updatePlayerList(data.players);
                 break;
 
-            case 'room_joined':
+            case MT.ROOM_JOINED:
                 document.getElementById('display-room-code').textContent = data.room_code;
                 this.updatePlayerList(data.players);
                 if (data.host === this.playerName) {
@@ -133,47 +151,47 @@ class RealTimeGame {
                 }
                 break;
 
-            case 'player_joined':
-            case 'player_left':
-            case 'player_answered':
+            case MT.PLAYER_JOINED:
+            case MT.PLAYER_LEFT:
+            case MT.PLAYER_ANSWERED:
                 this.updatePlayerList(data.players);
                 break;
 
-            case 'error':
+            case MT.ERROR:
                 alert(data.message);
                 window.location.href = '/realtime';
                 break;
 
-            case 'room_closed':
+            case MT.ROOM_CLOSED:
                 alert(data.reason || 'Room was closed');
                 window.location.href = '/realtime';
                 break;
 
-            case 'countdown':
+            case MT.COUNTDOWN:
                 this.showCountdown(data.count);
                 break;
 
-            case 'game_start':
+            case MT.GAME_START:
                 this.startGame(data.total_questions);
                 break;
 
-            case 'question':
+            case MT.QUESTION:
                 this.showQuestion(data);
                 break;
 
-            case 'timer':
+            case MT.TIMER:
                 this.updateTimer(data.remaining);
                 break;
 
-            case 'answer_result':
+            case MT.ANSWER_RESULT:
                 this.showAnswerResult(data);
                 break;
 
-            case 'game_over':
+            case MT.GAME_OVER:
                 this.showGameOver(data);
                 break;
 
-            case 'chat':
+            case MT.CHAT:
                 // Could implement chat display here
                 break;
         }
@@ -161,7 +161,7 @@ class RoomGame {
         buttons.forEach(btn => btn.disabled = true);
 
         try {
-            const response = await fetch(`/api/check-answer?question_id=${question.id}&answer=${selectedIndex}`, {
+            const response = await fetch(`/api/check-answer?question_id=${question.id}&answer=${selectedIndex}&room_code=${this.roomCode}`, {
                 method: 'POST'
             });
             const result = await response.json();
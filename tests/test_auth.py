@@ -0,0 +1,182 @@
+"""Tests for auth module."""
+
+import pytest
+import hashlib
+import os
+import sqlite3
+import tempfile
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import auth
+
+
+@pytest.fixture(autouse=True)
+def temp_auth_db():
+    """Point the auth module at a temporary database for each test."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    original_path = auth.DB_PATH
+    auth.DB_PATH = path
+
+    yield path
+
+    auth.DB_PATH = original_path
+    os.close(fd)
+    os.unlink(path)
+
+
+def _seed_legacy_user(path: str, username: str, password: str) -> None:
+    """Insert a user row in the old hex-text password format."""
+    salt_hex = os.urandom(16).hex()
+    hash_hex = hashlib.sha256(salt_hex.encode() + password.encode()).hexdigest()
+    auth._get_connection()  # create the schema
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO users (username, password_hash, salt, display_name) VALUES (?, ?, ?, ?)",
+        (username, hash_hex, salt_hex, username)
+    )
+    conn.commit()
+    conn.close()
+
+
+def _password_row(path: str, username: str) -> tuple:
+    """Read a user's stored hash and salt with their SQLite storage types."""
+    conn = sqlite3.connect(path)
+    row = conn.execute(
+        "SELECT password_hash, typeof(password_hash), typeof(salt) FROM users WHERE username = ?",
+        (username,)
+    ).fetchone()
+    conn.close()
+    return row
+
+
+class TestLoginUser:
+    """Tests for login_user function."""
+
+    def test_login_registered_user(self):
+        """Should log in with the password used at registration."""
+        auth.register_user("alice", "secret")
+        result = auth.login_user("alice", "secret")
+        assert result["success"] is True
+        assert result["user"]["username"] == "alice"
+
+    def test_wrong_password(self):
+        """Should reject a wrong password."""
+        auth.register_user("alice", "secret")
+        assert auth.login_user("alice", "nope")["success"] is False
+
+    def test_unknown_user(self):
+        """Should reject an unknown username."""
+        assert auth.login_user("nobody", "secret")["success"] is False
+
+    def test_legacy_hex_hash_login(self, temp_auth_db):
+        """Should verify a legacy hex-text hash."""
+        _seed_legacy_user(temp_auth_db, "oldtimer", "hunter2")
+        result = auth.login_user("oldtimer", "hunter2")
+        assert result["success"] is True
+
+    def test_legacy_row_rewritten_as_blob(self, temp_auth_db):
+        """A legacy row should be stored as raw bytes after a successful login."""
+        _seed_legacy_user(temp_auth_db, "oldtimer", "hunter2")
+        assert _password_row(temp_auth_db, "oldtimer")[1:] == ("text", "text")
+
+        auth.login_user("oldtimer", "hunter2")
+
+        stored_hash, hash_type, salt_type = _password_row(temp_auth_db, "oldtimer")
+        assert (hash_type, salt_type) == ("blob", "blob")
+        assert len(stored_hash) == 32
+        # The rewritten row still accepts the same password
+        assert auth.login_user("oldtimer", "hunter2")["success"] is True
+
+    def test_legacy_wrong_password_not_rewritten(self, temp_auth_db):
+        """A failed login should leave the legacy row untouched."""
+        _seed_legacy_user(temp_auth_db, "oldtimer", "hunter2")
+        assert auth.login_user("oldtimer", "wrong")["success"] is False
+        assert _password_row(temp_auth_db, "oldtimer")[1] == "text"
+
+
+class TestGetUserFromSession:
+    """Tests for session creation and lookup."""
+
+    def test_session_round_trip(self, temp_auth_db):
+        """A token from login should resolve back to the same user."""
+        auth.register_user("alice", "secret", "Alice")
+        login = auth.login_user("alice", "secret")
+
+        user = auth.get_user_from_session(login["session_token"])
+        assert user is not None
+        assert user["id"] == login["user"]["id"]
+        assert user["display_name"] == "Alice"
+
+    def test_token_stored_as_raw_bytes(self, temp_auth_db):
+        """The base64 cookie token should be stored as its decoded bytes."""
+        auth.register_user("alice", "secret")
+        token = auth.login_user("alice", "secret")["session_token"]
+
+        conn = sqlite3.connect(temp_auth_db)
+        stored, stored_type = conn.execute(
+            "SELECT session_token, typeof(session_token) FROM sessions"
+        ).fetchone()
+        conn.close()
+        assert stored_type == "blob"
+        assert len(stored) == auth._TOKEN_BYTES
+        assert auth._token_key(token) == stored
+
+    def test_unknown_token(self):
+        """An unknown token should not resolve to a user."""
+        assert auth.get_user_from_session("A" * 32) is None
+
+    def test_invalid_base64_token(self):
+        """A token that is not valid base64 should be rejected."""
+        assert auth.get_user_from_session("not*base64!") is None
+
+    def test_logged_out_token(self):
+        """A token should stop working after logout."""
+        auth.register_user("alice", "secret")
+        token = auth.login_user("alice", "secret")["session_token"]
+        assert auth.logout_user(token) is True
+        assert auth.get_user_from_session(token) is None
+
+
+class TestSaveGameResultsBulk:
+    """Tests for save_game_results_bulk function."""
+
+    def test_totals_after_bulk_save(self):
+        """Stats should reflect every game in the batch."""
+        user_id = auth.register_user("alice", "secret")["user"]["id"]
+        stats = auth.save_game_results_bulk(user_id, [
+            {"score": 100, "correct": 5, "total": 10, "best_streak": 3},
+            {"score": 250, "correct": 9, "total": 10, "best_streak": 7},
+            {"score": 40, "correct": 2, "total": 10, "best_streak": 1},
+        ])
+
+        assert stats == {
+            "total_games": 3,
+            "total_score": 390,
+            "highest_score": 250,
+            "best_streak": 7
+        }
+        full = auth.get_user_stats(user_id)
+        assert full["total_correct"] == 16
+        assert full["total_answered"] == 30
+        assert len(full["recent_games"]) == 3
+
+    def test_bulk_save_adds_to_existing_totals(self):
+        """A second batch should add to, not replace, the earlier totals."""
+        user_id = auth.register_user("alice", "secret")["user"]["id"]
+        auth.save_game_result(user_id, {"score": 300, "correct": 8, "total": 10, "best_streak": 8})
+        stats = auth.save_game_results_bulk(user_id, [
+            {"score": 100, "correct": 5, "total": 10, "best_streak": 2},
+        ])
+        assert stats["total_games"] == 2
+        assert stats["total_score"] == 400
+        assert stats["highest_score"] == 300
+        assert stats["best_streak"] == 8
+
+    def test_empty_batch(self):
+        """An empty batch should save nothing."""
+        user_id = auth.register_user("alice", "secret")["user"]["id"]
+        assert auth.save_game_results_bulk(user_id, []) == {}
+        assert auth.get_user_stats(user_id)["total_games"] == 0
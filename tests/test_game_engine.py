@@ -12,6 +12,7 @@ from game_engine import (
     submit_answer,
     is_game_over,
     get_final_score,
+    replay_scores,
     _calculate_streak_multiplier,
     DIFFICULTY_POINTS,
     STREAK_BONUSES,
@@ -85,57 +86,73 @@ class TestStartGame:
     """Tests for start_game function."""
 
     def test_returns_game_state(self, sample_questions):
-        """Should return a GameState dict."""
+        """Should return a GameState instance."""
         state = start_game(sample_questions)
-        assert isinstance(state, dict)
+        assert isinstance(state, GameState)
+
+    def test_state_has_no_instance_dict(self, sample_questions):
+        """GameState should be slotted, without a per-instance __dict__."""
+        state = start_game(sample_questions)
+        assert not hasattr(state, "__dict__")
 
     def test_initializes_questions(self, sample_questions):
         """Should store provided questions."""
         state = start_game(sample_questions)
-        assert state["questions"] == sample_questions
-        assert len(state["questions"]) == 3
+        assert state.questions == sample_questions
+        assert len(state.questions) == 3
+        assert state.num_questions == 3
 
     def test_starts_at_first_question(self, sample_questions):
         """Should start at question index 0."""
         state = start_game(sample_questions)
-        assert state["current_question_index"] == 0
+        assert state.current_question_index == 0
 
     def test_initializes_score_to_zero(self, sample_questions):
         """Should start with 0 score."""
         state = start_game(sample_questions)
-        assert state["score"] == 0
+        assert state.score == 0
 
     def test_initializes_lives(self, sample_questions):
         """Should start with STARTING_LIVES."""
         state = start_game(sample_questions)
-        assert state["lives"] == STARTING_LIVES
-        assert state["lives"] == 3
+        assert state.lives == STARTING_LIVES
+        assert state.lives == 3
 
     def test_initializes_streak_to_zero(self, sample_questions):
         """Should start with 0 streak."""
         state = start_game(sample_questions)
-        assert state["streak"] == 0
+        assert state.streak == 0
 
     def test_initializes_max_streak_to_zero(self, sample_questions):
         """Should start with 0 max_streak."""
         state = start_game(sample_questions)
-        assert state["max_streak"] == 0
+        assert state.max_streak == 0
 
     def test_initializes_correct_answers_to_zero(self, sample_questions):
         """Should start with 0 correct answers."""
         state = start_game(sample_questions)
-        assert state["correct_answers"] == 0
+        assert state.correct_answers == 0
 
     def test_initializes_total_answered_to_zero(self, sample_questions):
         """Should start with 0 total answered."""
         state = start_game(sample_questions)
-        assert state["total_answered"] == 0
+        assert state.total_answered == 0
 
     def test_empty_questions_list(self):
         """Should handle empty questions list."""
         state = start_game([])
-        assert state["questions"] == []
-        assert state["current_question_index"] == 0
+        assert state.questions == []
+        assert state.current_question_index == 0
+
+    def test_extracts_answers(self, sample_questions):
+        """Should precompute each question's answer index."""
+        state = start_game(sample_questions)
+        assert list(state.answers) == [2, 1, 1]
+
+    def test_extracts_base_points(self, sample_questions):
+        """Should precompute each question's difficulty points."""
+        state = start_game(sample_questions)
+        assert list(state.base_points) == [10, 20, 30]
 
 
 class TestGetCurrentQuestion:
@@ -148,13 +165,13 @@ class TestGetCurrentQuestion:
 
     def test_returns_correct_question_after_advance(self, game_state, sample_questions):
         """Should return question at current index."""
-        game_state["current_question_index"] = 1
+        game_state.current_question_index = 1
         question = get_current_question(game_state)
         assert question == sample_questions[1]
 
     def test_returns_none_when_exhausted(self, game_state):
         """Should return None when all questions answered."""
-        game_state["current_question_index"] = len(game_state["questions"])
+        game_state.current_question_index = len(game_state.questions)
         question = get_current_question(game_state)
         assert question is None
 
@@ -166,7 +183,7 @@ class TestGetCurrentQuestion:
 
     def test_returns_none_when_index_exceeds_length(self, game_state):
         """Should return None when index exceeds questions length."""
-        game_state["current_question_index"] = 100
+        game_state.current_question_index = 100
         question = get_current_question(game_state)
         assert question is None
 
@@ -209,6 +226,10 @@ class TestCalculateStreakMultiplier:
         assert _calculate_streak_multiplier(15) == 3.0
         assert _calculate_streak_multiplier(100) == 3.0
 
+    def test_streak_beyond_table_cap(self):
+        """Streaks longer than the lookup table should keep the top bonus."""
+        assert _calculate_streak_multiplier(10_000) == 3.0
+
 
 class TestSubmitAnswer:
     """Tests for submit_answer function."""
@@ -221,7 +242,7 @@ class TestSubmitAnswer:
         is_correct, points, new_state = result
         assert isinstance(is_correct, bool)
         assert isinstance(points, int)
-        assert isinstance(new_state, dict)
+        assert isinstance(new_state, GameState)
 
     def test_correct_answer_returns_true(self, game_state):
         """Should return True for correct answer."""
@@ -248,77 +269,75 @@ class TestSubmitAnswer:
     def test_advances_question_index(self, game_state):
         """Should advance to next question."""
         _, _, new_state = submit_answer(game_state, 2)
-        assert new_state["current_question_index"] == 1
+        assert new_state.current_question_index == 1
 
     def test_increments_total_answered(self, game_state):
         """Should increment total_answered count."""
         _, _, new_state = submit_answer(game_state, 2)
-        assert new_state["total_answered"] == 1
+        assert new_state.total_answered == 1
 
     def test_correct_increments_correct_answers(self, game_state):
         """Should increment correct_answers for correct answer."""
         _, _, new_state = submit_answer(game_state, 2)
-        assert new_state["correct_answers"] == 1
+        assert new_state.correct_answers == 1
 
     def test_wrong_does_not_increment_correct_answers(self, game_state):
         """Should not increment correct_answers for wrong answer."""
         _, _, new_state = submit_answer(game_state, 0)
-        assert new_state["correct_answers"] == 0
+        assert new_state.correct_answers == 0
 
     def test_correct_increments_streak(self, game_state):
         """Should increment streak for correct answer."""
         _, _, new_state = submit_answer(game_state, 2)
-        assert new_state["streak"] == 1
+        assert new_state.streak == 1
 
     def test_wrong_resets_streak(self, game_state):
         """Should reset streak to 0 for wrong answer."""
         # First build a streak
         _, _, state = submit_answer(game_state, 2)
-        assert state["streak"] == 1
+        assert state.streak == 1
         # Then answer wrong
         _, _, new_state = submit_answer(state, 0)  # Q2 has answer=1
-        assert new_state["streak"] == 0
+        assert new_state.streak == 0
 
     def test_wrong_decrements_lives(self, game_state):
         """Should decrement lives for wrong answer."""
         _, _, new_state = submit_answer(game_state, 0)
-        assert new_state["lives"] == 2
+        assert new_state.lives == 2
 
     def test_correct_does_not_affect_lives(self, game_state):
         """Should not change lives for correct answer."""
         _, _, new_state = submit_answer(game_state, 2)
-        assert new_state["lives"] == 3
+        assert new_state.lives == 3
 
     def test_updates_max_streak(self, game_state):
         """Should track maximum streak achieved."""
         _, _, state = submit_answer(game_state, 2)
-        assert state["max_streak"] == 1
+        assert state.max_streak == 1
         _, _, state = submit_answer(state, 1)  # Q2 answer is 1
-        assert state["max_streak"] == 2
+        assert state.max_streak == 2
 
     def test_max_streak_preserved_after_wrong(self, game_state):
         """Max streak should be preserved even after wrong answer."""
         # Build streak of 2
         _, _, state = submit_answer(game_state, 2)
         _, _, state = submit_answer(state, 1)
-        assert state["max_streak"] == 2
+        assert state.max_streak == 2
         # Wrong answer
         _, _, state = submit_answer(state, 0)  # Q3 answer is 1
-        assert state["streak"] == 0
-        assert state["max_streak"] == 2  # Still 2
+        assert state.streak == 0
+        assert state.max_streak == 2  # Still 2
 
-    def test_immutable_state_update(self, game_state):
-        """Should not modify original state."""
-        original_score = game_state["score"]
-        original_lives = game_state["lives"]
-        _, _, new_state = submit_answer(game_state, 2)
-        assert game_state["score"] == original_score
-        assert game_state["lives"] == original_lives
-        assert new_state is not game_state
+    def test_updates_state_in_place(self, game_state):
+        """Should mutate and return the same state object."""
+        _, points, new_state = submit_answer(game_state, 2)
+        assert new_state is game_state
+        assert game_state.score == points
+        assert game_state.current_question_index == 1
 
     def test_submit_when_no_question(self, game_state):
         """Should handle submission when no current question."""
-        game_state["current_question_index"] = 100
+        game_state.current_question_index = 100
         is_correct, points, new_state = submit_answer(game_state, 0)
         assert is_correct is False
         assert points == 0
@@ -424,7 +443,7 @@ class TestStreakBonusScoring:
         # Answer 5 correct in a row: 10 + 10 + 15 + 15 + 20 = 70
         for _ in range(5):
             _, _, state = submit_answer(state, 0)
-        assert state["score"] == 70
+        assert state.score == 70
 
 
 class TestStreakReset:
@@ -436,10 +455,10 @@ class TestStreakReset:
         # Build streak of 3
         for _ in range(3):
             _, _, state = submit_answer(state, 0)
-        assert state["streak"] == 3
+        assert state.streak == 3
         # Wrong answer
         _, _, state = submit_answer(state, 1)  # Wrong
-        assert state["streak"] == 0
+        assert state.streak == 0
 
     def test_bonus_lost_after_streak_reset(self, easy_questions):
         """Next correct answer after reset should not have bonus."""
@@ -462,7 +481,7 @@ class TestStreakReset:
         _, _, state = submit_answer(state, 1)  # Reset
         for _ in range(3):
             _, _, state = submit_answer(state, 0)
-        assert state["streak"] == 3
+        assert state.streak == 3
         _, points, _ = submit_answer(state, 0)
         assert points == 15  # 1.5x bonus
 
@@ -472,29 +491,29 @@ class TestLivesSystem:
 
     def test_starts_with_three_lives(self, game_state):
         """Should start with 3 lives."""
-        assert game_state["lives"] == 3
+        assert game_state.lives == 3
 
     def test_lose_life_on_wrong_answer(self, game_state):
         """Should lose one life per wrong answer."""
         _, _, state = submit_answer(game_state, 0)  # Wrong
-        assert state["lives"] == 2
+        assert state.lives == 2
         _, _, state = submit_answer(state, 0)  # Wrong
-        assert state["lives"] == 1
+        assert state.lives == 1
 
     def test_lives_can_reach_zero(self, game_state):
         """Lives can decrease to zero."""
         state = game_state
         for _ in range(3):
             _, _, state = submit_answer(state, 0)  # All wrong
-        assert state["lives"] == 0
+        assert state.lives == 0
 
     def test_lives_can_go_negative(self, sample_questions):
         """Implementation allows lives to go negative."""
         # This depends on whether game checks lives before processing
         state = start_game(sample_questions)
-        state["lives"] = 0
+        state.lives = 0
         _, _, new_state = submit_answer(state, 0)
-        assert new_state["lives"] == -1
+        assert new_state.lives == -1
 
 
 class TestIsGameOver:
@@ -506,24 +525,24 @@ class TestIsGameOver:
 
     def test_over_when_lives_zero(self, game_state):
         """Game should be over when lives reach 0."""
-        game_state["lives"] = 0
+        game_state.lives = 0
         assert is_game_over(game_state) is True
 
     def test_over_when_lives_negative(self, game_state):
         """Game should be over when lives negative."""
-        game_state["lives"] = -1
+        game_state.lives = -1
         assert is_game_over(game_state) is True
 
     def test_over_when_all_questions_answered(self, sample_questions):
         """Game should be over when all questions answered."""
         state = start_game(sample_questions)
-        state["current_question_index"] = len(sample_questions)
+        state.current_question_index = len(sample_questions)
         assert is_game_over(state) is True
 
     def test_not_over_mid_game(self, game_state):
         """Game should not be over mid-game."""
-        game_state["current_question_index"] = 1
-        game_state["lives"] = 2
+        game_state.current_question_index = 1
+        game_state.lives = 2
         assert is_game_over(game_state) is False
 
     def test_over_on_last_life_lost(self, sample_questions):
@@ -620,7 +639,7 @@ class TestGetFinalScore:
         """Completed should be false when game ends early."""
         state = start_game(sample_questions)
         # Lose all lives on first question
-        state["lives"] = 1
+        state.lives = 1
         _, _, state = submit_answer(state, 0)  # Wrong, game over
         result = get_final_score(state)
         assert result["completed"] is False
@@ -667,7 +686,7 @@ class TestGameStateTransitions:
             _, _, state = submit_answer(state, 1)  # Wrong
 
         assert is_game_over(state) is True
-        assert state["current_question_index"] == 3  # Only answered 3
+        assert state.current_question_index == 3  # Only answered 3
         result = get_final_score(state)
         assert result["completed"] is False
 
@@ -685,8 +704,41 @@ class TestGameStateTransitions:
         _, points3, state = submit_answer(state, 0)  # Hard correct (no streak bonus, reset)
         assert points3 == 30
 
-        assert state["score"] == 40
-        assert state["lives"] == 2
+        assert state.score == 40
+        assert state.lives == 2
+
+
+class TestReplayScores:
+    """Tests for replay_scores batch scorer."""
+
+    def test_empty_replay(self):
+        """No answers should leave score at zero and full lives."""
+        assert replay_scores([], []) == (0, 0, STARTING_LIVES)
+
+    def test_matches_submit_answer(self, mixed_difficulty_questions):
+        """Replay should agree with playing the same answers one by one."""
+        answers = [0, 1, 0]
+        state = start_game(mixed_difficulty_questions)
+        for answer in answers:
+            _, _, state = submit_answer(state, answer)
+
+        score, max_streak, lives = replay_scores(
+            [q["difficulty"] for q in mixed_difficulty_questions],
+            [a == q["answer"] for a, q in zip(answers, mixed_difficulty_questions)],
+        )
+        assert (score, max_streak, lives) == (state.score, state.max_streak, state.lives)
+
+    def test_applies_streak_bonus(self):
+        """Streak multipliers should apply as in submit_answer."""
+        score, max_streak, _ = replay_scores(["easy"] * 5, [True] * 5)
+        assert score == 10 + 10 + 15 + 15 + 20
+        assert max_streak == 5
+
+    def test_stops_when_lives_run_out(self):
+        """Answers after the last life is lost should be ignored."""
+        score, _, lives = replay_scores(["easy"] * 4, [False, False, False, True])
+        assert score == 0
+        assert lives == 0
 
 
 class TestEdgeCases:
@@ -730,14 +782,14 @@ class TestEdgeCases:
             _, points, state = submit_answer(state, 0)
 
         # After 10, should stay at 3x
-        assert state["streak"] == 14
+        assert state.streak == 14
         _, last_points, _ = submit_answer(state, 0)
         assert last_points == 30  # 10 * 3.0
 
     def test_state_after_game_over(self, sample_questions):
         """Test behavior when submitting after game over."""
         state = start_game(sample_questions)
-        state["lives"] = 0  # Manually set game over
+        state.lives = 0  # Manually set game over
 
         is_correct, points, new_state = submit_answer(state, 0)
         # Implementation still processes the answer
@@ -2,6 +2,7 @@
 
 import pytest
 import sqlite3
+import json
 import os
 import tempfile
 from datetime import datetime
@@ -47,6 +48,73 @@ class TestLeaderboardDatabase:
         assert result is not None
         assert result[0] == 'high_scores'
 
+    def test_init_db_creates_indexes(self):
+        """Should create the score lookup indexes."""
+        conn = sqlite3.connect(self.temp_path)
+        names = {
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='high_scores'"
+            )
+        }
+        conn.close()
+        assert {"idx_top_scores", "idx_player_best"} <= names
+
+    def test_top_and_rank_queries_use_index_order(self):
+        """Top-scores and rank queries should be served by the index with no sort."""
+        conn = sqlite3.connect(self.temp_path)
+        top_plan = [row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + leaderboard._SQL_TOP, (10,)
+        )]
+        rank_plan = [row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + leaderboard._SQL_RANK_CHECK, (100, 100, 1)
+        )]
+        conn.close()
+
+        for plan in (top_plan, rank_plan):
+            assert not any("TEMP B-TREE" in step for step in plan)
+        assert any("idx_top_scores" in step for step in top_plan)
+        assert all("idx_top_scores" in step for step in rank_plan if step.startswith("SEARCH"))
+
+    def test_init_db_enables_wal(self):
+        """Should switch the database to write-ahead logging."""
+        conn = sqlite3.connect(self.temp_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
+    def test_init_db_migrates_text_dates(self):
+        """Should convert a legacy TEXT date column to epoch seconds."""
+        conn = sqlite3.connect(self.temp_path)
+        conn.execute("DROP TABLE high_scores")
+        conn.execute("""
+            CREATE TABLE high_scores (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_name TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                date TEXT NOT NULL,
+                category TEXT,
+                difficulty TEXT,
+                total_questions INTEGER
+            )
+        """)
+        conn.execute(
+            "INSERT INTO high_scores (player_name, score, date) VALUES ('Old', 120, '2024-03-05 12:00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        leaderboard.init_db()
+
+        conn = sqlite3.connect(self.temp_path)
+        date_type = conn.execute(
+            "SELECT type FROM pragma_table_info('high_scores') WHERE name = 'date'"
+        ).fetchone()[0]
+        conn.close()
+        assert date_type == "INTEGER"
+        best = leaderboard.get_player_best("Old")
+        assert best["score"] == 120
+        assert best["date"] == "2024-03-05"
+
     def test_init_db_idempotent(self):
         """Calling init_db multiple times should not cause errors."""
         # Should not raise any exceptions
@@ -66,6 +134,30 @@ class TestLeaderboardDatabase:
         assert conn.row_factory == sqlite3.Row
         conn.close()
 
+    def test_pooled_connection_is_reused(self):
+        """Connections should be returned to the pool and reused."""
+        with leaderboard._connection() as first:
+            pass
+        with leaderboard._connection() as second:
+            pass
+        assert first is second
+
+    def test_pool_discards_connection_for_old_path(self):
+        """Changing DATABASE_PATH should not reuse a stale connection."""
+        with leaderboard._connection() as first:
+            pass
+
+        fd, other_path = tempfile.mkstemp(suffix='.db')
+        leaderboard.DATABASE_PATH = other_path
+        try:
+            with leaderboard._connection() as second:
+                pass
+            assert first is not second
+        finally:
+            leaderboard.DATABASE_PATH = self.temp_path
+            os.close(fd)
+            os.unlink(other_path)
+
 
 class TestSaveScore:
     """Tests for save_score function."""
@@ -186,6 +278,52 @@ class TestSaveScore:
         assert result["made_leaderboard"] is False
         assert result["rank"] is None
 
+    def test_save_score_tracks_top10_cutoff(self):
+        """Should cache the 10th-highest score once the top 10 is full."""
+        for i in range(9):
+            leaderboard.save_score(f"Player{i}", 100 + i)
+        assert leaderboard._TOP10_CUTOFF == 0
+
+        leaderboard.save_score("Tenth", 50)
+        assert leaderboard._TOP10_CUTOFF == 50
+
+        result = leaderboard.save_score("Climber", 500)
+        assert result["rank"] == 1
+        assert leaderboard._TOP10_CUTOFF == 100
+
+    def test_save_score_tie_at_cutoff_not_ranked(self):
+        """A score equal to a full board's 10th place should not displace it."""
+        for i in range(10):
+            leaderboard.save_score(f"Player{i}", 100)
+
+        result = leaderboard.save_score("Latecomer", 100)
+        assert result["made_leaderboard"] is False
+        assert result["rank"] is None
+
+        names = [s["player_name"] for s in leaderboard.get_top_scores(10)]
+        assert "Latecomer" not in names
+
+    def test_save_score_tie_rank_matches_top_scores(self):
+        """A tied score's reported rank should match its place in the list."""
+        leaderboard.save_score("Leader", 300)
+        for i in range(5):
+            leaderboard.save_score(f"Player{i}", 200)
+
+        result = leaderboard.save_score("Tied", 200)
+        assert result["rank"] == 7
+
+        scores = leaderboard.get_top_scores(10)
+        assert scores[result["rank"] - 1]["player_name"] == "Tied"
+
+    def test_init_db_loads_top10_cutoff(self):
+        """Should reload the cutoff from existing scores on init."""
+        for i in range(12):
+            leaderboard.save_score(f"Player{i}", i * 10)
+        leaderboard._TOP10_CUTOFF = 0
+
+        leaderboard.init_db()
+        assert leaderboard._TOP10_CUTOFF == 20
+
 
 class TestGetTopScores:
     """Tests for get_top_scores function."""
@@ -273,6 +411,37 @@ class TestGetTopScores:
         assert date_str[4] == '-'
         assert date_str[7] == '-'
 
+    def test_get_top_scores_served_from_cache(self):
+        """Repeated reads within the TTL should not hit the database."""
+        leaderboard.save_score("Cached", 100)
+        first = leaderboard.get_top_scores()
+
+        with patch.object(leaderboard, "_query_top_scores") as mock_query:
+            second = leaderboard.get_top_scores()
+
+        mock_query.assert_not_called()
+        assert second == first
+
+    def test_save_score_invalidates_cache(self):
+        """Saving a score should make the next read see it."""
+        leaderboard.save_score("First", 100)
+        _, old_etag = leaderboard.get_cached_top_scores()
+
+        leaderboard.save_score("Second", 200)
+        scores, new_etag = leaderboard.get_cached_top_scores()
+
+        assert scores[0]["player_name"] == "Second"
+        assert new_etag != old_etag
+
+    def test_top_scores_json_matches_scores(self):
+        """Pre-serialized body should encode the cached scores."""
+        leaderboard.save_score("Json", 100)
+        body, etag = leaderboard.get_top_scores_json()
+        scores, same_etag = leaderboard.get_cached_top_scores()
+
+        assert json.loads(body) == {"scores": scores}
+        assert etag == same_etag
+
     def test_get_top_scores_structure(self):
         """Each score should have expected fields."""
         leaderboard.save_score(
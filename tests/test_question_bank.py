@@ -10,10 +10,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from question_bank import (
     get_questions,
+    get_questions_progressive,
+    get_questions_by_difficulty,
+    get_questions_mixed,
     get_categories,
     get_difficulties,
     _load_questions_from_file,
     _flatten_questions,
+    _question_pool,
+    _grouped_questions,
 )
 
 
@@ -93,15 +98,15 @@ SAMPLE_QUESTIONS_DATA = {
 class TestGetCategories:
     """Tests for get_categories function."""
 
-    def test_returns_list(self):
-        """Should return a list."""
+    def test_returns_tuple(self):
+        """Should return an immutable tuple."""
         result = get_categories()
-        assert isinstance(result, list)
+        assert isinstance(result, tuple)
 
     def test_contains_expected_categories(self):
         """Should contain all expected categories."""
         categories = get_categories()
-        expected = ["ancient-civilizations", "medieval-europe", "world-wars", "cold-war", "ancient-philosophy", "revolutionary-periods", "science"]
+        expected = ("ancient-civilizations", "medieval-europe", "world-wars", "cold-war", "ancient-philosophy", "revolutionary-periods", "science")
         assert categories == expected
 
     def test_returns_seven_categories(self):
@@ -112,15 +117,15 @@ class TestGetCategories:
 class TestGetDifficulties:
     """Tests for get_difficulties function."""
 
-    def test_returns_list(self):
-        """Should return a list."""
+    def test_returns_tuple(self):
+        """Should return an immutable tuple."""
         result = get_difficulties()
-        assert isinstance(result, list)
+        assert isinstance(result, tuple)
 
     def test_contains_expected_difficulties(self):
         """Should contain all expected difficulty levels."""
         difficulties = get_difficulties()
-        expected = ["easy", "medium", "hard"]
+        expected = ("easy", "medium", "hard")
         assert difficulties == expected
 
     def test_returns_three_difficulties(self):
@@ -400,6 +405,83 @@ class TestGetQuestionsEdgeCases:
             get_questions(count=-1)
 
 
+class TestQuestionPool:
+    """Tests for the per-filter question pool cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_pool_cache(self):
+        """Start and end each test with empty pool caches."""
+        _question_pool.cache_clear()
+        _grouped_questions.cache_clear()
+        yield
+        _question_pool.cache_clear()
+        _grouped_questions.cache_clear()
+
+    @patch('question_bank._load_questions_from_file')
+    def test_pool_loaded_once_per_filter(self, mock_load):
+        """Repeated calls with the same filter should not reload the file."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        get_questions_mixed(count=2, categories=["ancient"])
+        get_questions_mixed(count=3, categories=["ancient"])
+        assert mock_load.call_count == 1
+
+    @patch('question_bank._load_questions_from_file')
+    def test_category_order_shares_pool(self, mock_load):
+        """The same categories in a different order should reuse the pool."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        get_questions_by_difficulty(count=2, categories=("ancient", "medieval"), difficulty="easy")
+        get_questions_by_difficulty(count=2, categories=["medieval", "ancient"], difficulty="easy")
+        assert mock_load.call_count == 1
+
+    @patch('question_bank._load_questions_from_file')
+    def test_mixed_draws_from_filtered_pool(self, mock_load):
+        """Mixed mode should only return questions from the chosen categories."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        result = get_questions_mixed(count=10, categories=["medieval"])
+        assert len(result) == len(_flatten_questions(SAMPLE_QUESTIONS_DATA, category="medieval"))
+        assert all(q["category"] == "medieval" for q in result)
+
+    @patch('question_bank._load_questions_from_file')
+    def test_progressive_orders_by_difficulty(self, mock_load):
+        """Progressive mode should still return easy before medium before hard."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        result = get_questions_progressive(count=6)
+        order = {"easy": 0, "medium": 1, "hard": 2}
+        ranks = [order[q["difficulty"]] for q in result]
+        assert ranks == sorted(ranks)
+
+    @patch('question_bank._load_questions_from_file')
+    def test_progressive_fills_shortfall_without_repeats(self, mock_load):
+        """A short difficulty should be topped up from the others, with no duplicates."""
+        data = {"cat": {
+            "easy": [{"question": f"e{i}"} for i in range(5)],
+            "medium": [{"question": "m0"}],
+            "hard": [{"question": "h0"}],
+        }}
+        mock_load.return_value = data
+        result = get_questions_progressive(count=6)
+        texts = [q["question"] for q in result]
+        assert len(texts) == 6
+        assert len(set(texts)) == 6
+
+    @patch('question_bank._load_questions_from_file')
+    def test_pool_matches_flatten(self, mock_load):
+        """Pools should hold the same questions, in the same order, as _flatten_questions."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        assert list(_question_pool(None, None)) == _flatten_questions(SAMPLE_QUESTIONS_DATA)
+        assert list(_question_pool(frozenset({"medieval"}), "easy")) == _flatten_questions(
+            SAMPLE_QUESTIONS_DATA, category="medieval", difficulty="easy"
+        )
+
+    @patch('question_bank._load_questions_from_file')
+    def test_pools_share_question_dicts(self, mock_load):
+        """A question should be the same object in every pool containing it."""
+        mock_load.return_value = SAMPLE_QUESTIONS_DATA
+        easy = _question_pool(None, "easy")
+        everything = _question_pool(None, None)
+        assert all(any(q is p for p in everything) for q in easy)
+
+
 class TestLoadQuestionsFromFile:
     """Tests for _load_questions_from_file function."""
 
@@ -411,6 +493,10 @@ class TestLoadQuestionsFromFile:
         assert "ancient-civilizations" in result
         assert "medieval-europe" in result
 
+    def test_parsed_once(self):
+        """Repeated loads should return the cached structure."""
+        assert _load_questions_from_file() is _load_questions_from_file()
+
     def test_real_file_has_expected_structure(self):
         """Real file should have nested category->difficulty structure."""
         result = _load_questions_from_file()
@@ -1,7 +1,9 @@
 """Tests for rooms module."""
 
 import pytest
+import importlib
 import sqlite3
+import threading
 import os
 import tempfile
 import json
@@ -61,6 +63,108 @@ class TestRoomsDatabase:
         rooms.init_rooms_db()
         rooms.init_rooms_db()
 
+    def test_init_creates_indexes(self):
+        """Should index room expiry and per-room standings."""
+        conn = sqlite3.connect(self.temp_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        names = {row[0] for row in cursor.fetchall()}
+        conn.close()
+        assert "idx_rooms_expires" in names
+        assert "idx_players_room_score" in names
+
+    def test_init_migrates_text_timestamps(self):
+        """Should convert legacy TEXT timestamp columns to epoch seconds."""
+        conn = sqlite3.connect(self.temp_path)
+        conn.execute("DROP TABLE room_players")
+        conn.execute("DROP TABLE rooms")
+        conn.execute("""
+            CREATE TABLE rooms (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                room_code TEXT UNIQUE NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                host_name TEXT NOT NULL,
+                categories TEXT,
+                difficulty TEXT,
+                question_ids TEXT NOT NULL,
+                status TEXT DEFAULT 'waiting'
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE room_players (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                room_id INTEGER NOT NULL,
+                player_name TEXT NOT NULL,
+                score INTEGER DEFAULT 0,
+                correct_count INTEGER DEFAULT 0,
+                best_streak INTEGER DEFAULT 0,
+                completed INTEGER DEFAULT 0,
+                completed_at TEXT,
+                FOREIGN KEY (room_id) REFERENCES rooms(id),
+                UNIQUE(room_id, player_name)
+            )
+        """)
+        expires = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        conn.execute(
+            "INSERT INTO rooms (room_code, created_at, expires_at, host_name, question_ids) VALUES ('OLD123', '2024-03-05 12:00:00', ?, 'Host', '[1]')",
+            (expires,)
+        )
+        conn.execute(
+            "INSERT INTO room_players (room_id, player_name, completed, completed_at) VALUES (1, 'Host', 1, '2024-03-05 12:30:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        rooms.init_rooms_db()
+
+        conn = sqlite3.connect(self.temp_path)
+        expires_type = conn.execute(
+            "SELECT type FROM pragma_table_info('rooms') WHERE name = 'expires_at'"
+        ).fetchone()[0]
+        conn.close()
+        assert expires_type == "INTEGER"
+        room = rooms.get_room("OLD123")
+        assert room["created_at"] == "2024-03-05 12:00:00"
+        assert room["expires_at"] == expires
+        assert rooms.get_room_players("OLD123")[0]["completed_at"] == "2024-03-05 12:30:00"
+
+    def test_init_enables_wal(self):
+        """Should switch the database to write-ahead logging."""
+        conn = sqlite3.connect(self.temp_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
+    def test_pooled_connection_is_reused(self):
+        """Connections should be returned to the pool and reused."""
+        with rooms._connection() as first:
+            pass
+        with rooms._connection() as second:
+            pass
+        assert first is second
+
+    def test_pool_discards_connection_left_in_transaction(self):
+        """A connection with an open transaction should not be pooled."""
+        with rooms._connection() as first:
+            first.execute("UPDATE rooms SET status = 'playing'")
+        with rooms._connection() as second:
+            pass
+        assert first is not second
+
+    def test_standings_query_uses_index(self):
+        """Standings should be read in index order without a sort step."""
+        conn = sqlite3.connect(self.temp_path)
+        plan = conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT player_name FROM room_players
+            WHERE room_id = ? ORDER BY score DESC, completed_at ASC
+        """, (1,)).fetchall()
+        conn.close()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_players_room_score" in details
+        assert "TEMP B-TREE" not in details
+
 
 class TestGenerateRoomCode:
     """Tests for room code generation."""
@@ -137,6 +241,28 @@ class TestCreateRoom:
         result = rooms.create_room("TestHost", [1, 2, 3])
         assert "expires_at" in result
 
+    def test_retries_duplicate_code(self):
+        """A colliding code should be replaced with a fresh one."""
+        with patch.object(rooms, "_generate_room_code", side_effect=["AAAAAA", "AAAAAA", "BBBBBB"]):
+            first = rooms.create_room("Host1", [1])
+            second = rooms.create_room("Host2", [2])
+        assert first["room_code"] == "AAAAAA"
+        assert second["room_code"] == "BBBBBB"
+        assert rooms.get_room("BBBBBB")["host_name"] == "Host2"
+
+    def test_missing_host_name_raises(self):
+        """A NOT NULL failure should raise instead of being retried."""
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            rooms.create_room(None, [1, 2])
+
+    def test_gives_up_after_repeated_collisions(self):
+        """Endless code collisions should raise once the attempts run out."""
+        rooms.create_room("Host1", [1])
+        with patch.object(rooms, "_generate_room_code", return_value="AAAAAA"):
+            rooms.create_room("Host2", [1])
+            with pytest.raises(sqlite3.IntegrityError, match="No free room code"):
+                rooms.create_room("Host3", [1])
+
     def test_host_added_as_player(self):
         """Host should be added as first player."""
         result = rooms.create_room("HostPlayer", [1, 2, 3])
@@ -151,6 +277,18 @@ class TestCreateRoom:
         room = rooms.get_room(result["room_code"])
         assert room["question_ids"] == question_ids
 
+    def test_reads_legacy_json_question_ids(self):
+        """Rooms stored with JSON question IDs should still load."""
+        result = rooms.create_room("TestHost", [1])
+        conn = sqlite3.connect(self.temp_path)
+        conn.execute(
+            "UPDATE rooms SET question_ids = '[7, 8, 9]' WHERE room_code = ?",
+            (result["room_code"],)
+        )
+        conn.commit()
+        conn.close()
+        assert rooms.get_room(result["room_code"])["question_ids"] == [7, 8, 9]
+
     def test_stores_categories(self):
         """Should store categories."""
         result = rooms.create_room(
@@ -201,6 +339,44 @@ class TestCreateRoom:
         assert room["status"] == "waiting"
 
 
+class TestCreateRoomsBulk:
+    """Tests for create_rooms_bulk function."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_db(self):
+        """Set up a temporary database for each test."""
+        self.temp_fd, self.temp_path = tempfile.mkstemp(suffix='.db')
+        self.original_db_path = rooms.DATABASE_PATH
+        rooms.DATABASE_PATH = self.temp_path
+        rooms.init_rooms_db()
+
+        yield
+
+        rooms.DATABASE_PATH = self.original_db_path
+        os.close(self.temp_fd)
+        os.unlink(self.temp_path)
+
+    def test_creates_every_room(self):
+        """Each spec should produce a room with its host as a player."""
+        results = rooms.create_rooms_bulk([
+            {"host_name": "Host1", "question_ids": [1, 2]},
+            {"host_name": "Host2", "question_ids": [3], "difficulty": "hard"},
+        ])
+
+        assert len(results) == 2
+        assert len({r["room_code"] for r in results}) == 2
+        second = rooms.get_room(results[1]["room_code"])
+        assert second["host_name"] == "Host2"
+        assert second["question_ids"] == [3]
+        assert second["difficulty"] == "hard"
+        players = rooms.get_room_players(results[0]["room_code"])
+        assert [p["player_name"] for p in players] == ["Host1"]
+
+    def test_empty_specs(self):
+        """No specs should create no rooms."""
+        assert rooms.create_rooms_bulk([]) == []
+
+
 class TestGetRoom:
     """Tests for get_room function."""
 
@@ -243,6 +419,21 @@ class TestGetRoom:
         assert room_upper is not None
         assert room_lower is not None
 
+    def test_repeat_lookup_served_from_cache(self):
+        """A second lookup should not query the database again."""
+        code = rooms.create_room("Host", [1, 2, 3])["room_code"]
+        first = rooms.get_room(code)
+        with patch.object(rooms, "_get_connection", side_effect=AssertionError("queried")):
+            with patch.object(rooms, "_POOL", rooms.queue.LifoQueue()):
+                assert rooms.get_room(code.lower()) is first
+
+    def test_cached_room_expires(self):
+        """A cached room should stop being returned once it expires."""
+        code = rooms.create_room("Host", [1, 2, 3], expires_hours=1)["room_code"]
+        assert rooms.get_room(code) is not None
+        with patch.object(rooms.time, "time", return_value=rooms.time.time() + 7200):
+            assert rooms.get_room(code) is None
+
     def test_returns_none_for_expired(self):
         """Should return None for expired rooms."""
         # Create room with very short expiration
@@ -251,7 +442,7 @@ class TestGetRoom:
         # Manually set expiration to the past
         conn = rooms._get_connection()
         cursor = conn.cursor()
-        past_time = (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        past_time = int((datetime.now() - timedelta(hours=1)).timestamp())
         cursor.execute(
             "UPDATE rooms SET expires_at = ? WHERE room_code = ?",
             (past_time, create_result["room_code"])
@@ -339,6 +530,17 @@ class TestJoinRoom:
         result = rooms.join_room(create_result["room_code"], "Player")
         assert result["success"] is True
         assert result["already_joined"] is True
+        assert result["already_completed"] is False
+
+    def test_rejoin_after_completing(self):
+        """Rejoining after finishing should report the game as completed."""
+        create_result = rooms.create_room("Host", [1, 2, 3])
+        rooms.join_room(create_result["room_code"], "Player")
+        rooms.save_room_score(create_result["room_code"], "Player", 100, 5, 3)
+
+        result = rooms.join_room(create_result["room_code"], "Player")
+        assert result["already_joined"] is True
+        assert result["already_completed"] is True
 
     def test_returns_room_info(self):
         """Should return room info on successful join."""
@@ -520,6 +722,37 @@ class TestSaveRoomScore:
 
         assert result["rank"] == 2  # Second place
 
+    def test_rank_matches_player_position(self):
+        """Rank should match the player's place in the returned list."""
+        code = rooms.create_room("Host", [1, 2, 3])["room_code"]
+        for name in ("A", "B", "C"):
+            rooms.join_room(code, name)
+        rooms.save_room_score(code, "A", 300, 9, 6)
+        rooms.save_room_score(code, "B", 50, 2, 1)
+        result = rooms.save_room_score(code, "C", 120, 5, 2)
+
+        names = [p["player_name"] for p in result["players"]]
+        assert names == ["A", "C", "B", "Host"]
+        assert result["rank"] == 2
+
+    def test_rank_only_matches_full_save(self):
+        """The rank-only save should report the same rank as the full save."""
+        code = rooms.create_room("Host", [1, 2, 3])["room_code"]
+        for name in ("A", "B", "C"):
+            rooms.join_room(code, name)
+        rooms.save_room_score(code, "A", 300, 9, 6)
+        rooms.save_room_score(code, "B", 50, 2, 1)
+
+        result = rooms.save_room_score_rank_only(code, "C", 120, 5, 2)
+        assert result == {"success": True, "rank": 2}
+        assert rooms.save_room_score(code, "C", 120, 5, 2)["rank"] == 2
+
+    def test_rank_only_unknown_player(self):
+        """A player not in the room should get no rank."""
+        code = rooms.create_room("Host", [1, 2, 3])["room_code"]
+        result = rooms.save_room_score_rank_only(code, "Nobody", 10, 1, 1)
+        assert result["rank"] is None
+
     def test_returns_players_list(self):
         """Should return updated players list."""
         create_result = rooms.create_room("Host", [1, 2, 3])
@@ -570,7 +803,7 @@ class TestCleanupExpiredRooms:
         # Manually expire the room
         conn = rooms._get_connection()
         cursor = conn.cursor()
-        past_time = (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        past_time = int((datetime.now() - timedelta(hours=1)).timestamp())
         cursor.execute(
             "UPDATE rooms SET expires_at = ? WHERE room_code = ?",
             (past_time, create_result["room_code"])
@@ -589,7 +822,7 @@ class TestCleanupExpiredRooms:
         # Manually expire the room
         conn = rooms._get_connection()
         cursor = conn.cursor()
-        past_time = (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        past_time = int((datetime.now() - timedelta(hours=1)).timestamp())
         cursor.execute(
             "UPDATE rooms SET expires_at = ? WHERE room_code = ?",
             (past_time, create_result["room_code"])
@@ -612,6 +845,75 @@ class TestCleanupExpiredRooms:
         assert count_after == 0
         conn.close()
 
+    def test_limit_deletes_oldest_first(self):
+        """A limited cleanup should remove only the longest-expired rooms."""
+        codes = [rooms.create_room(f"Host{i}", [1])["room_code"] for i in range(3)]
+        conn = rooms._get_connection()
+        for hours, code in zip((3, 2, 1), codes):
+            past_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
+            conn.execute("UPDATE rooms SET expires_at = ? WHERE room_code = ?", (past_time, code))
+        conn.commit()
+        conn.close()
+
+        assert rooms.cleanup_expired_rooms(limit=2) == 2
+
+        conn = rooms._get_connection()
+        remaining = [row[0] for row in conn.execute("SELECT room_code FROM rooms")]
+        players = [row[0] for row in conn.execute("SELECT player_name FROM room_players")]
+        conn.close()
+        assert remaining == [codes[2]]
+        assert players == ["Host2"]
+
+    def test_limit_through_equal_expiry_leaves_no_orphans(self):
+        """A limit that splits rooms with the same expiry should keep players with their rooms."""
+        codes = [rooms.create_room(f"Host{i}", [1])["room_code"] for i in range(5)]
+        past_time = int((datetime.now() - timedelta(hours=1)).timestamp())
+        conn = rooms._get_connection()
+        conn.execute("UPDATE rooms SET expires_at = ?", (past_time,))
+        conn.commit()
+        conn.close()
+
+        assert rooms.cleanup_expired_rooms(limit=2) == 2
+
+        conn = rooms._get_connection()
+        orphans = conn.execute(
+            "SELECT COUNT(*) FROM room_players WHERE room_id NOT IN (SELECT id FROM rooms)"
+        ).fetchone()[0]
+        remaining = conn.execute("SELECT COUNT(*) FROM rooms").fetchone()[0]
+        players = conn.execute("SELECT COUNT(*) FROM room_players").fetchone()[0]
+        conn.close()
+        assert orphans == 0
+        assert remaining == players == 3
+
+    def test_cleanup_thread_started_once(self):
+        """The background sweeper should only be started once per process."""
+        def sweepers():
+            return [t for t in threading.enumerate() if t.name == rooms._CLEANUP_THREAD_NAME]
+
+        assert len(sweepers()) == 1
+        rooms.start_cleanup_thread()
+        importlib.reload(rooms)
+        assert len(sweepers()) == 1
+
+    def test_cleanup_loop_survives_unexpected_errors(self):
+        """A non-SQLite error should be logged and the sweeper keep running."""
+        calls = []
+
+        def failing_cleanup(limit=None):
+            calls.append(limit)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            raise SystemExit  # stop the loop on the second sweep
+
+        with patch.object(rooms.time, "sleep"), \
+                patch.object(rooms, "cleanup_expired_rooms", side_effect=failing_cleanup), \
+                patch.object(rooms.logger, "exception") as log:
+            with pytest.raises(SystemExit):
+                rooms._cleanup_loop()
+
+        assert len(calls) == 2
+        log.assert_called_once()
+
     def test_keeps_active_rooms(self):
         """Should not remove active rooms."""
         create_result = rooms.create_room("Host", [1, 2, 3])
@@ -0,0 +1,94 @@
+"""Tests for scoring_numba module."""
+
+import importlib.util
+import random
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scoring_numba
+from game_engine import replay_scores, STARTING_LIVES, _DIFF_INDEX, _STREAK_CAP
+from scoring_numba import score_game
+
+
+class TestScoreGame:
+    """Tests for score_game batch scorer (compiled or fallback path)."""
+
+    def test_empty_game(self):
+        """No answers should leave score at zero and full lives."""
+        assert score_game([], []) == (0, 0, STARTING_LIVES)
+
+    def test_applies_streak_bonus(self):
+        """Streak multipliers should apply as in submit_answer."""
+        score, max_streak, _ = score_game(["easy"] * 5, [True] * 5)
+        assert score == 10 + 10 + 15 + 15 + 20
+        assert max_streak == 5
+
+    def test_unknown_difficulty_scores_as_easy(self):
+        """Unknown difficulties should fall back to easy points."""
+        assert score_game(["legendary"], [True])[0] == 10
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_replay_scores(self, seed):
+        """Should agree with the pure-Python replay on random games."""
+        rng = random.Random(seed)
+        difficulties = [rng.choice(["easy", "medium", "hard"]) for _ in range(30)]
+        correct = [rng.random() < 0.8 for _ in range(30)]
+        assert score_game(difficulties, correct) == replay_scores(difficulties, correct)
+
+    def test_active_path_matches_environment(self):
+        """The compiled path should be active exactly when numba and numpy import."""
+        available = all(
+            importlib.util.find_spec(name) is not None for name in ("numba", "numpy")
+        )
+        assert scoring_numba._NUMBA_AVAILABLE is available
+
+
+class TestScoreGameKernel:
+    """Tests calling the compiled kernel directly (skipped without numba)."""
+
+    @pytest.fixture(autouse=True)
+    def require_numba(self):
+        """Skip unless the compiled path is available."""
+        pytest.importorskip("numba")
+        self.np = pytest.importorskip("numpy")
+        assert scoring_numba._NUMBA_AVAILABLE
+
+    def run_kernel(self, difficulties, correct):
+        """Encode a game and score it with _score_game_kernel."""
+        np = self.np
+        codes = np.array([_DIFF_INDEX.get(d, 0) for d in difficulties], dtype=np.int8)
+        answers = np.array(correct, dtype=np.bool_)
+        score, max_streak, lives = scoring_numba._score_game_kernel(
+            codes, answers, scoring_numba._POINTS_ARRAY,
+            scoring_numba._MULT_BY_STREAK, STARTING_LIVES
+        )
+        return int(score), int(max_streak), int(lives)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_replay_scores(self, seed):
+        """Kernel should agree with the pure-Python replay on random games."""
+        rng = random.Random(seed)
+        difficulties = [rng.choice(["easy", "medium", "hard"]) for _ in range(30)]
+        correct = [rng.random() < 0.8 for _ in range(30)]
+        assert self.run_kernel(difficulties, correct) == replay_scores(difficulties, correct)
+
+    def test_streak_past_cap(self):
+        """Streaks longer than the multiplier table should use the capped entry."""
+        n = _STREAK_CAP + 50
+        difficulties = ["hard"] * n
+        correct = [True] * n
+        result = self.run_kernel(difficulties, correct)
+        assert result == replay_scores(difficulties, correct)
+        assert result[1] == n
+
+    def test_stops_when_lives_exhausted(self):
+        """Answers after the last life is lost should not score."""
+        difficulties = ["medium"] * 8
+        correct = [True, False, False, False, True, True, True, True]
+        result = self.run_kernel(difficulties, correct)
+        assert result == replay_scores(difficulties, correct)
+        assert result == (20, 1, 0)
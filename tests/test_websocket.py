@@ -5,6 +5,9 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
+import orjson
+from fastapi import WebSocketDisconnect
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -13,6 +16,8 @@ from websocket_manager import (
     WebSocketManager,
     Player,
     RealTimeRoom,
+    MessageType,
+    MAX_MESSAGE_SIZE,
     manager as global_manager
 )
 
@@ -57,7 +62,7 @@ class TestRealTimeRoom:
 
         assert room.players == {}
         assert room.questions == []
-        assert room.question_ids == []
+        assert list(room.question_ids) == []
         assert room.current_question_index == 0
         assert room.status == "waiting"
         assert room.categories == ""
@@ -174,7 +179,8 @@ class TestCreateRoom:
         )
 
         assert room.questions == questions
-        assert room.question_ids == question_ids
+        assert list(room.question_ids) == question_ids
+        assert room.question_ids.typecode == "H"
 
     @pytest.mark.asyncio
     async def test_stores_settings(self, manager, mock_websocket):
@@ -440,8 +446,8 @@ class TestBroadcastToRoom:
         message = {"type": "test", "data": "hello"}
         await manager.broadcast_to_room(room.code, message)
 
-        host_ws.send_json.assert_called_with(message)
-        player_ws.send_json.assert_called_with(message)
+        host_ws.send_text.assert_called_with(orjson.dumps(message).decode())
+        player_ws.send_text.assert_called_with(orjson.dumps(message).decode())
 
     @pytest.mark.asyncio
     async def test_handles_nonexistent_room(self):
@@ -458,11 +464,106 @@ class TestBroadcastToRoom:
         room = await manager.create_room("Host", host_ws, [], [])
 
         # Make the websocket throw an exception
-        host_ws.send_json.side_effect = Exception("Connection closed")
+        host_ws.send_text.side_effect = Exception("Connection closed")
 
         # Should not raise
         await manager.broadcast_to_room(room.code, {"type": "test"})
 
+    @pytest.mark.asyncio
+    async def test_drops_player_whose_send_times_out(self):
+        """A stalled send should not block others and should remove that player."""
+        manager = WebSocketManager()
+        host_ws = AsyncMock()
+        room = await manager.create_room("Host", host_ws, [], [])
+        slow_ws = AsyncMock()
+        await manager.join_room(room.code, "Slow", slow_ws)
+
+        async def stall(_):
+            await asyncio.Event().wait()
+        slow_ws.send_text.side_effect = stall
+
+        with patch('websocket_manager.SEND_TIMEOUT', 0.01):
+            await manager.broadcast_to_room(room.code, {"type": "test"})
+
+        host_ws.send_text.assert_any_call(orjson.dumps({"type": "test"}).decode())
+        assert "Slow" not in room.players
+
+    @pytest.mark.asyncio
+    async def test_encodes_message_once(self):
+        """Should encode the message once for all players."""
+        manager = WebSocketManager()
+        host_ws = AsyncMock()
+        room = await manager.create_room("Host", host_ws, [], [])
+        player_ws = AsyncMock()
+        await manager.join_room(room.code, "Player", player_ws)
+
+        with patch('websocket_manager.orjson.dumps', wraps=orjson.dumps) as dumps:
+            await manager.broadcast_to_room(room.code, {"type": "test"})
+
+        assert dumps.call_count == 1
+        assert host_ws.send_text.call_args == player_ws.send_text.call_args
+
+    @pytest.mark.asyncio
+    async def test_sends_preencoded_text_as_is(self):
+        """Should send an already-encoded message without re-encoding it."""
+        manager = WebSocketManager()
+        host_ws = AsyncMock()
+        room = await manager.create_room("Host", host_ws, [], [])
+
+        await manager.broadcast_to_room(room.code, '{"type":"test"}')
+
+        host_ws.send_text.assert_called_with('{"type":"test"}')
+
+
+class TestReceiveJson:
+    """Tests for receive_json helper."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_text_frame(self):
+        """Should decode a JSON text frame."""
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.receive", "text": '{"type": "chat"}'}
+        assert await WebSocketManager.receive_json(ws) == {"type": "chat"}
+
+    @pytest.mark.asyncio
+    async def test_decodes_binary_frame(self):
+        """Should decode a JSON binary frame."""
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.receive", "bytes": b'{"answer": 2}'}
+        assert await WebSocketManager.receive_json(ws) == {"answer": 2}
+
+    @pytest.mark.asyncio
+    async def test_skips_oversized_frame(self):
+        """Should not parse frames over MAX_MESSAGE_SIZE."""
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.receive", "text": '"' + "x" * 5000 + '"'}
+        assert await WebSocketManager.receive_json(ws) == {}
+
+    @pytest.mark.asyncio
+    async def test_skips_multibyte_frame_over_byte_limit(self):
+        """Should cap text frames by UTF-8 bytes, not characters."""
+        # 2 quotes + 1366 three-byte characters = 4100 bytes, but only 1368 characters
+        text = '"' + "€" * 1366 + '"'
+        assert len(text) < MAX_MESSAGE_SIZE < len(text.encode())
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.receive", "text": text}
+        assert await WebSocketManager.receive_json(ws) == {}
+
+    @pytest.mark.asyncio
+    async def test_decodes_multibyte_frame_within_limit(self):
+        """Should still parse multi-byte text that fits in the byte limit."""
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.receive", "text": '{"chat": "€uro"}'}
+        assert await WebSocketManager.receive_json(ws) == {"chat": "€uro"}
+
+    @pytest.mark.asyncio
+    async def test_raises_on_disconnect(self):
+        """Should raise WebSocketDisconnect when the client goes away."""
+        ws = AsyncMock()
+        ws.receive.return_value = {"type": "websocket.disconnect", "code": 1001}
+        with pytest.raises(WebSocketDisconnect):
+            await WebSocketManager.receive_json(ws)
+
 
 class TestSendToPlayer:
     """Tests for send_to_player method."""
@@ -485,9 +586,9 @@ class TestSendToPlayer:
         message = {"type": "private"}
         await manager.send_to_player(room.code, "Player", message)
 
-        player_ws.send_json.assert_called_with(message)
+        player_ws.send_text.assert_called_with(orjson.dumps(message).decode())
         # Host should not receive
-        assert host_ws.send_json.call_count == 0
+        assert host_ws.send_text.call_count == 0
 
     @pytest.mark.asyncio
     async def test_handles_nonexistent_player(self):
@@ -629,8 +730,8 @@ class TestEndGame:
             await manager.end_game(room.code)
 
         # Find the game_over call
-        calls = host_ws.send_json.call_args_list
-        game_over_call = [c for c in calls if c[0][0].get("type") == "game_over"]
+        calls = [orjson.loads(c[0][0]) for c in host_ws.send_text.call_args_list]
+        game_over_call = [c for c in calls if c.get("t") == MessageType.GAME_OVER]
         assert len(game_over_call) > 0
 
 
@@ -25,13 +25,65 @@ The manager handles the game lifecycle:
 5. Game ends, final standings displayed
 """
 
-import json
 import asyncio
+from array import array
 import random
 import string
-from typing import Optional, Any
+from typing import Optional, Any, Sequence, Union
 from dataclasses import dataclass, field
-from fastapi import WebSocket
+from enum import IntEnum
+from fastapi import WebSocket, WebSocketDisconnect
+import orjson
+
+# Seconds a broadcast waits on one player's send before dropping them
+SEND_TIMEOUT: float = 2.0
+
+# Largest inbound frame, in bytes, that is parsed; client messages are
+# small settings, answers and chat lines well under this
+MAX_MESSAGE_SIZE: int = 4096
+
+
+class MessageType(IntEnum):
+    """
+    Server-to-client message types, sent as the "t" field of each frame.
+
+    Small integers keep every frame, including the once-a-second timer
+    ticks sent to every player, shorter than spelled-out type names.
+    static/realtime-game.js mirrors these values in its MT table.
+    """
+    ROOM_CREATED = 1
+    ROOM_JOINED = 2
+    PLAYER_JOINED = 3
+    PLAYER_LEFT = 4
+    PLAYER_ANSWERED = 5
+    ERROR = 6
+    ROOM_CLOSED = 7
+    COUNTDOWN = 8
+    GAME_START = 9
+    QUESTION = 10
+    TIMER = 11
+    ANSWER_RESULT = 12
+    GAME_OVER = 13
+    CHAT = 14
+
+
+def encode_message(message: dict[str, Any]) -> str:
+    """
+    Encode a message as the JSON text sent in a WebSocket frame.
+
+    Args:
+        message: The message dictionary.
+
+    Returns:
+        The message as compact JSON text.
+    """
+    return orjson.dumps(message).decode()
+
+
+# Countdown frames never change, so they are encoded once at import
+_COUNTDOWN_FRAMES: dict[int, str] = {
+    i: encode_message({"t": MessageType.COUNTDOWN, "count": i}) for i in range(1, 4)
+}
 
 
 @dataclass
@@ -75,7 +127,7 @@ class RealTimeRoom:
         host_name: Name of the player who created the room (controls game start).
         players: Dictionary mapping player names to Player objects.
         questions: List of question dictionaries for this game.
-        question_ids: List of question IDs (for answer checking via main module).
+        question_ids: Question IDs sent with each question, as a compact int array.
         current_question_index: Index of the current/next question.
         status: Game state - 'waiting', 'countdown', 'playing', 'showing_answer', 'finished'.
         categories: Category filter string used when creating the room.
@@ -86,7 +138,7 @@ class RealTimeRoom:
     host_name: str
     players: dict[str, Player] = field(default_factory=dict)
     questions: list[dict[str, Any]] = field(default_factory=list)
-    question_ids: list[int] = field(default_factory=list)
+    question_ids: array = field(default_factory=lambda: array("H"))
     current_question_index: int = 0
     status: str = "waiting"  # waiting, countdown, playing, showing_answer, finished
     categories: str = ""
@@ -115,6 +167,50 @@ class WebSocketManager:
         self.rooms: dict[str, RealTimeRoom] = {}
         self.player_rooms: dict[str, str] = {}  # player_name -> room_code
 
+    @staticmethod
+    async def send_json(websocket: WebSocket, message: dict[str, Any]) -> None:
+        """
+        Send a message to one connection as a JSON text frame.
+
+        Encodes with orjson rather than the stdlib json used by
+        WebSocket.send_json.
+
+        Args:
+            websocket: The connection to send to.
+            message: Dictionary to send as JSON.
+        """
+        await websocket.send_text(encode_message(message))
+
+    @staticmethod
+    async def receive_json(websocket: WebSocket) -> Any:
+        """
+        Receive one JSON frame from a connection.
+
+        Reads the raw ASGI message and hands its payload straight to
+        orjson, so both text and binary frames are accepted and binary
+        payloads are never decoded to str first. Frames larger than
+        MAX_MESSAGE_SIZE bytes (UTF-8 encoded, for text frames) are not
+        parsed at all.
+
+        Args:
+            websocket: The connection to read from.
+
+        Returns:
+            The decoded message, or an empty dict for an oversized frame.
+
+        Raises:
+            WebSocketDisconnect: If the client disconnected.
+        """
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        text = message.get("text")
+        # Encode text frames so the cap counts UTF-8 bytes, not characters
+        data = message["bytes"] if text is None else text.encode()
+        if len(data) > MAX_MESSAGE_SIZE:
+            return {}
+        return orjson.loads(data)
+
     def _generate_code(self, length: int = 5) -> str:
         """
         Generate a unique alphanumeric room code.
@@ -138,7 +234,7 @@ class WebSocketManager:
         host_name: str,
         websocket: WebSocket,
         questions: list[dict[str, Any]],
-        question_ids: list[int],
+        question_ids: Sequence[int],
         categories: str = "",
         difficulty: str = "progressive"
     ) -> RealTimeRoom:
@@ -152,7 +248,8 @@ class WebSocketManager:
             host_name: Display name of the room creator.
             websocket: The host's WebSocket connection.
             questions: List of question dictionaries for the game.
-            question_ids: Corresponding question IDs for answer validation.
+            question_ids: Corresponding question IDs; stored as an unsigned
+                short array.
             categories: Category filter string (for display purposes).
             difficulty: Difficulty mode string (for display purposes).
 
@@ -164,7 +261,7 @@ class WebSocketManager:
             code=code,
             host_name=host_name,
             questions=questions,
-            question_ids=question_ids,
+            question_ids=array("H", question_ids),
             categories=categories,
             difficulty=difficulty
         )
@@ -241,13 +338,13 @@ class WebSocketManager:
                 del self.rooms[room_code]
                 # Notify remaining players
                 await self.broadcast_to_room(room_code, {
-                    "type": "room_closed",
+                    "t": MessageType.ROOM_CLOSED,
                     "reason": "Host left the game"
                 })
             else:
                 # Notify others that player left
                 await self.broadcast_to_room(room_code, {
-                    "type": "player_left",
+                    "t": MessageType.PLAYER_LEFT,
                     "player": player_name,
                     "players": self._get_player_list(room)
                 })
@@ -292,27 +389,42 @@ class WebSocketManager:
             for p in room.players.values()
         ]
 
-    async def broadcast_to_room(self, room_code: str, message: dict[str, Any]) -> None:
+    async def broadcast_to_room(
+        self,
+        room_code: str,
+        message: Union[dict[str, Any], str]
+    ) -> None:
         """
         Send a JSON message to all players in a room.
 
-        Handles connection errors gracefully by removing disconnected
-        players from the room.
+        The message is encoded once and the same text is sent to every
+        player concurrently. Players whose send fails or takes longer than
+        SEND_TIMEOUT seconds are removed from the room.
 
         Args:
             room_code: The room code to broadcast to.
-            message: Dictionary to send as JSON to all players.
+            message: Dictionary to send as JSON to all players, or a
+                message already encoded as JSON text.
         """
         room = self.rooms.get(room_code)
         if not room:
             return
 
-        disconnected = []
-        for player_name, player in room.players.items():
-            try:
-                await player.websocket.send_json(message)
-            except Exception:
-                disconnected.append(player_name)
+        payload = message if isinstance(message, str) else encode_message(message)
+
+        # Send to everyone concurrently so one slow client can't hold up
+        # the others; a send that fails or times out counts as a disconnect
+        recipients = list(room.players.items())
+        results = await asyncio.gather(
+            *(asyncio.wait_for(player.websocket.send_text(payload), SEND_TIMEOUT)
+              for _, player in recipients),
+            return_exceptions=True
+        )
+        disconnected = [
+            player_name
+            for (player_name, _), result in zip(recipients, results)
+            if isinstance(result, BaseException)
+        ]
 
         # Clean up disconnected players
         for name in disconnected:
@@ -339,7 +451,7 @@ class WebSocketManager:
             return
 
         try:
-            await room.players[player_name].websocket.send_json(message)
+            await self.send_json(room.players[player_name].websocket, message)
         except Exception:
             await self.leave_room(player_name)
 
@@ -372,14 +484,11 @@ class WebSocketManager:
 
         # Countdown
         for i in range(3, 0, -1):
-            await self.broadcast_to_room(room_code, {
-                "type": "countdown",
-                "count": i
-            })
+            await self.broadcast_to_room(room_code, _COUNTDOWN_FRAMES[i])
             await asyncio.sleep(1)
 
         await self.broadcast_to_room(room_code, {
-            "type": "game_start",
+            "t": MessageType.GAME_START,
             "total_questions": len(room.questions)
         })
 
@@ -419,7 +528,7 @@ class WebSocketManager:
         question_id = room.question_ids[room.current_question_index]
 
         await self.broadcast_to_room(room_code, {
-            "type": "question",
+            "t": MessageType.QUESTION,
             "question_number": room.current_question_index + 1,
             "total_questions": len(room.questions),
             "question_id": question_id,
@@ -460,7 +569,7 @@ class WebSocketManager:
 
             # Broadcast time remaining
             await self.broadcast_to_room(room_code, {
-                "type": "timer",
+                "t": MessageType.TIMER,
                 "remaining": remaining - 1
             })
 
@@ -493,7 +602,7 @@ class WebSocketManager:
 
         # Notify all players that this player answered
         await self.broadcast_to_room(room_code, {
-            "type": "player_answered",
+            "t": MessageType.PLAYER_ANSWERED,
             "player": player_name,
             "players": self._get_player_list(room)
         })
@@ -563,7 +672,7 @@ class WebSocketManager:
         results.sort(key=lambda x: x["score"], reverse=True)
 
         await self.broadcast_to_room(room_code, {
-            "type": "answer_result",
+            "t": MessageType.ANSWER_RESULT,
             "correct_answer": correct_answer,
             "explanation": question["explanation"],
             "results": results,
@@ -609,7 +718,7 @@ class WebSocketManager:
         )
 
         await self.broadcast_to_room(room_code, {
-            "type": "game_over",
+            "t": MessageType.GAME_OVER,
             "standings": final_standings,
             "total_questions": len(room.questions)
         })